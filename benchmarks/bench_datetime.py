@@ -0,0 +1,111 @@
+"""
+Benchmarks of terra.datetime scalar arithmetic, calendar construction,
+parsing and the conversion of epoch offsets to datetimes.
+
+"""
+import numpy as np
+
+import terra.datetime as datetime
+
+
+calendars = ['G360Day', 'G365Day', 'GregorianNoLeapSecond', 'ISOGregorian']
+
+lengths = [10, 10 ** 3, 10 ** 5, 10 ** 7]
+
+# The largest offset of each axis, in the axis unit.
+magnitudes = [10 ** 2, 10 ** 6]
+
+units = ['days', 'hours', 'seconds']
+
+
+class DateArithmetic(object):
+    params = [calendars, ['days', 'months', 'years']]
+    param_names = ['calendar', 'unit']
+
+    def setup(self, calendar, unit):
+        calendar = datetime.get_calendar(calendar)
+        self.date = datetime.date(1850, 1, 31, calendar=calendar)
+        self.delta = datetime.timedelta(**{unit: 100})
+
+    def time_add(self, calendar, unit):
+        self.date + self.delta
+
+
+class CalendarDurationDays(object):
+    params = [calendars]
+    param_names = ['calendar']
+
+    def setup(self, calendar):
+        calendar = datetime.get_calendar(calendar)
+        start = datetime.date(1850, 1, 1, calendar=calendar)
+        end = datetime.date(2100, 12, 30, calendar=calendar)
+        self.duration = datetime.CalendarDuration(end, start)
+
+    def time_days(self, calendar):
+        self.duration.days
+
+
+class CalendarConstruction(object):
+    params = [calendars]
+    param_names = ['calendar']
+
+    def setup(self, calendar):
+        self.cls = type(datetime.get_calendar(calendar))
+
+    def time_interned(self, calendar):
+        self.cls()
+
+    def time_construct(self, calendar):
+        # Drop the interned instance, so every call builds the calendar.
+        datetime._calendars.pop(self.cls, None)
+        self.cls()
+
+
+class ParseDatetime(object):
+    params = [calendars]
+    param_names = ['calendar']
+
+    def setup(self, calendar):
+        self.calendar = datetime.get_calendar(calendar)
+
+    def time_parse_datetime(self, calendar):
+        datetime.parse_datetime('1970-01-01 12:30:15.25', self.calendar)
+
+
+class ParseDatetimes(object):
+    params = [calendars, lengths]
+    param_names = ['calendar', 'length']
+
+    def setup(self, calendar, length):
+        self.calendar = datetime.get_calendar(calendar)
+        epoch = datetime.datetime(1850, 1, 1, calendar=self.calendar)
+        offsets = np.linspace(0, 10 ** 9, length).astype(np.int64)
+        sample = datetime.EpochDateTimes(offsets, 'seconds', epoch=epoch)
+        self.strings = sample.datetimes()
+
+    def time_parse_datetimes(self, calendar, length):
+        datetime.parse_datetimes(self.strings, self.calendar)
+
+    def peakmem_parse_datetimes(self, calendar, length):
+        datetime.parse_datetimes(self.strings, self.calendar)
+
+
+class EpochDateTimesDatetimes(object):
+    params = [calendars, lengths, magnitudes, units]
+    param_names = ['calendar', 'length', 'magnitude', 'unit']
+    timeout = 300
+
+    def setup(self, calendar, length, magnitude, unit):
+        calendar = datetime.get_calendar(calendar)
+        epoch = datetime.datetime(1850, 1, 1, calendar=calendar)
+        offsets = np.linspace(0, magnitude, length).astype(np.int64)
+        self.sample = datetime.EpochDateTimes(offsets, unit, epoch=epoch)
+
+    def time_ordinals_ticks(self, calendar, length, magnitude, unit):
+        self.sample.ordinals_ticks()
+
+    def time_datetimes(self, calendar, length, magnitude, unit):
+        self.sample.datetimes()
+
+    def peakmem_datetimes(self, calendar, length, magnitude, unit):
+        self.sample.datetimes()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+"""
+Run the terra benchmarks without airspeed velocity.
+
+Benchmark classes are found in the bench_*.py modules of this directory
+and run the way asv runs them: for each combination of their params,
+setup is called, then each time_* and peakmem_* method.  Wall time is the
+best of several repeats of timeit; peak memory is the largest traced
+allocation during one call, measured with tracemalloc.
+
+"""
+from __future__ import print_function
+
+import argparse
+import gc
+import glob
+import importlib
+import itertools
+import os
+import re
+import sys
+import timeit
+import tracemalloc
+
+
+DIR_BENCHMARKS = os.path.dirname(os.path.abspath(__file__))
+DIR_ROOT = os.path.dirname(DIR_BENCHMARKS)
+
+
+def _benchmark_classes():
+    # Yield (name, class) for the benchmark classes of each bench module.
+    for path in sorted(glob.glob(os.path.join(DIR_BENCHMARKS,
+                                              'bench_*.py'))):
+        name = os.path.splitext(os.path.basename(path))[0]
+        module = importlib.import_module('benchmarks.' + name)
+        for attr in sorted(vars(module)):
+            cls = getattr(module, attr)
+            if (isinstance(cls, type) and cls.__module__ == module.__name__
+                    and _methods(cls)):
+                yield '{}.{}'.format(name, attr), cls
+
+
+def _methods(cls):
+    return [attr for attr in sorted(dir(cls))
+            if attr.startswith(('time_', 'peakmem_'))]
+
+
+def _combinations(cls):
+    params = getattr(cls, 'params', [])
+    if params and not isinstance(params[0], (list, tuple)):
+        params = [params]
+    return list(itertools.product(*params))
+
+
+def _time(func, args, repeat):
+    timer = timeit.Timer(lambda: func(*args))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def _peakmem(func, args):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def _format_time(seconds):
+    for unit, scale in [('s', 1), ('ms', 1e-3), ('us', 1e-6)]:
+        if seconds >= scale:
+            break
+    return '{:.3f}{}'.format(seconds / scale, unit)
+
+
+def _format_bytes(nbytes):
+    for unit, scale in [('G', 2 ** 30), ('M', 2 ** 20), ('k', 2 ** 10)]:
+        if nbytes >= scale:
+            break
+    else:
+        unit, scale = '', 1
+    return '{:.1f}{}'.format(nbytes / float(scale), unit)
+
+
+def run(pattern=None, max_length=None, repeat=5):
+    """
+    Run the benchmarks whose names match the regular expression pattern,
+    printing one line per measurement, and return the results as a list
+    of (name, params, kind, value) tuples.
+
+    """
+    results = []
+    for name, cls in _benchmark_classes():
+        param_names = getattr(cls, 'param_names', [])
+        for method in _methods(cls):
+            full_name = '{}.{}'.format(name, method)
+            if pattern is not None and not re.search(pattern, full_name):
+                continue
+            for args in _combinations(cls):
+                named = dict(zip(param_names, args))
+                if (max_length is not None and
+                        named.get('length', 0) > max_length):
+                    continue
+                bench = cls()
+                if hasattr(bench, 'setup'):
+                    bench.setup(*args)
+                func = getattr(bench, method)
+                if method.startswith('time_'):
+                    kind, value = 'time', _time(func, args, repeat)
+                    shown = _format_time(value)
+                else:
+                    kind, value = 'peakmem', _peakmem(func, args)
+                    shown = _format_bytes(value)
+                if hasattr(bench, 'teardown'):
+                    bench.teardown(*args)
+                label = ', '.join('{}={}'.format(key, arg) for key, arg
+                                  in zip(param_names, args))
+                print('{:<60} {:>12}  {}'.format(full_name, shown, label))
+                sys.stdout.flush()
+                results.append((full_name, named, kind, value))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split(
+        '\n')[0])
+    parser.add_argument('-b', '--bench', help='only run the benchmarks '
+                        'whose names match this regular expression')
+    parser.add_argument('--max-length', type=int, help='skip parameter '
+                        'combinations with a longer axis length')
+    parser.add_argument('--repeat', type=int, default=5, help='the number '
+                        'of timing repeats, the best of which is reported')
+    args = parser.parse_args(argv)
+    # Prefer the terra of this checkout to an installed terra.
+    sys.path[:0] = [DIR_ROOT, os.path.join(DIR_ROOT, 'lib')]
+    run(args.bench, args.max_length, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -13,11 +13,15 @@ Different Calendars are supported, but numerical conversions between calendars
  knowledge and logic is required.
 
 """
-import copy
+import bisect
 import numpy as np
 import numpy.ma
+import os
 import re
-import requests
+import six
+import sys
+import time as _time
+import warnings
 
 import terra.units
 
@@ -30,6 +34,11 @@ dtstring_patterns = [re.compile('^([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})'
                      re.compile('^([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})')]
 
 
+# The number of microseconds in each sub-day temporal quantity.
+_unit_microseconds = {'hours': 3600000000, 'minutes': 60000000,
+                      'seconds': 1000000, 'microseconds': 1}
+
+
 def parse_datetime(instring, calendar):
     """
     Returns a `terra.datetime.datetime` from a given string and terra Calendar.
@@ -51,11 +60,162 @@ def parse_datetime(instring, calendar):
     return result
 
 
+def parse_datetime_components(strings, calendar):
+    """
+    Parse an array, or iterable, of ISO datetime strings into arrays of the
+    year, month, day, hour, minute, second and microsecond of each string.
+
+    The fixed width 'YYYY-MM-DDThh:mm:ss', 'YYYY-MM-DD hh:mm:ss' and
+    'YYYY-MM-DD' forms, optionally with up to six fractional second
+    digits, are decoded with array arithmetic on the character codes;
+    other strings are matched against the patterns of
+    :func:`parse_datetime`.
+
+    Returns a tuple of the seven component arrays, a boolean array which is
+    True for malformed strings and strings which are not dates of the
+    calendar, and the date and time separator of the first string with a
+    time.
+
+    """
+    if not isinstance(calendar, Calendar):
+        raise TypeError('calendar must be a terra.datetime.Calendar.')
+    if not isinstance(strings, (np.ndarray, six.string_types, bytes)):
+        strings = list(strings)
+    strings = np.asarray(strings)
+    shape = strings.shape
+    if strings.dtype.kind not in 'SU':
+        strings = strings.astype(six.text_type)
+    strings = np.ascontiguousarray(strings.ravel())
+    if strings.dtype.kind == 'S':
+        codes = strings.view(np.uint8)
+    else:
+        codes = strings.view(np.uint32)
+    codes = codes.reshape((strings.size,
+                           strings.dtype.itemsize // codes.dtype.itemsize))
+    # The character codes by column, padded with nulls to one column past
+    # the longest fixed form.
+    columns = np.zeros((27, strings.size), codes.dtype)
+    width = min(codes.shape[1], 27)
+    columns[:width] = codes[:, :width].T
+    # Digit values by column; values above 9 are not digits.
+    digits = columns[:26] - codes.dtype.type(ord('0'))
+
+    def is_char(column, char):
+        return columns[column] == ord(char)
+
+    def all_digits(indices):
+        result = digits[indices[0]] < 10
+        for column in indices[1:]:
+            result &= digits[column] < 10
+        return result
+
+    fixed = (all_digits([0, 1, 2, 3, 5, 6, 8, 9]) & is_char(4, '-') &
+             is_char(7, '-'))
+    has_time = (all_digits([11, 12, 14, 15, 17, 18]) & is_char(13, ':') &
+                is_char(16, ':') & (is_char(10, 'T') | is_char(10, ' ')))
+    # Fractional seconds have between one and six digits.
+    has_fraction = is_char(19, '.') & (digits[20] < 10) & is_char(26, '\0')
+    ended = np.zeros(strings.size, dtype=bool)
+    for column in range(21, 26):
+        ended |= is_char(column, '\0')
+        has_fraction &= ended | (digits[column] < 10)
+    fixed &= (is_char(10, '\0') |
+              has_time & (is_char(19, '\0') | has_fraction))
+    has_time &= fixed
+    has_fraction &= has_time
+
+    def value(column, ndigits):
+        result = digits[column].astype(np.int64)
+        for i in range(1, ndigits):
+            result = result * 10 + digits[column + i]
+        return result
+
+    components = [value(column, ndigits) for column, ndigits in
+                  [(0, 4), (5, 2), (8, 2), (11, 2), (14, 2), (17, 2)]]
+    microseconds = np.zeros(strings.size, dtype=np.int64)
+    for column in range(20, 26):
+        microseconds = microseconds * 10 + np.where(digits[column] < 10,
+                                                    digits[column], 0)
+    components.append(microseconds * has_fraction)
+    for component in components[3:6]:
+        component *= has_time
+
+    tsep = None
+    if has_time.any():
+        tsep = six.unichr(int(columns[10, np.argmax(has_time)]))
+    # Strings of other layouts are matched one at a time.
+    for i in np.flatnonzero(~fixed & ~is_char(0, '\0')):
+        instring = strings[i]
+        if isinstance(instring, bytes):
+            instring = instring.decode('ascii', 'replace')
+        match = _match_datetime(instring)
+        if match is not None:
+            fixed[i] = True
+            for component, value in zip(components, match[:6]):
+                component[i] = value
+            if tsep is None:
+                tsep = match[6]
+
+    years, months, days, hours, minutes, seconds = components[:6]
+    malformed = ~fixed | ~((months >= 1) & (months <= calendar.months_in_year))
+    months = np.where(malformed, 1, months)
+    leap = calendar.leap_year_mask(years).astype(np.intp)
+    cumulative = calendar._cumulative_days_array
+    month_days = cumulative[leap, months] - cumulative[leap, months - 1]
+    malformed |= ((days < 1) | (days > month_days) | (hours > 23) |
+                  (minutes > 59) | (seconds > 59) |
+                  np.isin(years, calendar.null_years))
+    for component in components:
+        component[malformed] = 0
+    for component in components[:3]:
+        component[malformed] = 1
+    components = tuple(component.reshape(shape) for component in components)
+    if tsep is None:
+        tsep = 'T'
+    return components, malformed.reshape(shape), tsep
+
+
+def parse_datetimes(strings, calendar):
+    """
+    Parse an array, or iterable, of ISO datetime strings into a
+    :class:`DatetimeArray` of the given terra Calendar.
+
+    Returns the DatetimeArray and a boolean array which is True for
+    malformed strings, which are given as midnight of 1 January year 1.
+    See :func:`parse_datetime_components`.
+
+    """
+    components, malformed, tsep = parse_datetime_components(strings,
+                                                            calendar)
+    result = DatetimeArray.from_components(*components, calendar=calendar,
+                                           tsep=tsep)
+    return result, malformed
+
+
+def _match_datetime(instring):
+    # Return the year, month, day, hour, minute, second and separator of
+    # the first of the dtstring_patterns to match instring, or None.
+    result = None
+    for pattern in dtstring_patterns:
+        match = pattern.match(instring)
+        if match and len(match.groups()) == 7:
+            result = (int(match.group(1)), int(match.group(2)),
+                      int(match.group(3)), int(match.group(5)),
+                      int(match.group(6)), int(match.group(7)),
+                      match.group(4))
+        elif match:
+            result = (int(match.group(1)), int(match.group(2)),
+                      int(match.group(3)), 0, 0, 0, None)
+        if result is not None:
+            break
+    return result
+
+
 class date(object):
     """
     An idealized naive date,  Attributes: year, month, and day.
 
-    Objects of this type are not immutable.
+    Objects of this type are not immutable, see :class:`frozendate`.
 
     """
     def __init__(self, year, month, day, calendar=None):
@@ -63,11 +223,7 @@ class date(object):
         self.day = day
         self.calendar = calendar
         if calendar is not None:
-            if month in [mn[0:3] for mn in calendar.month_names]:
-                for i, mon in enumerate([mn[0:3] for mn in
-                                         calendar.month_names]):
-                    if month == mon:
-                        month = i + 1
+            month = calendar._month_numbers.get(month, month)
         self.month = month
 
     def __str__(self):
@@ -177,39 +333,9 @@ class date(object):
                                                             other.calendar))
             return CalendarDuration(self, other)
         elif isinstance(other, timedelta):
-            if self.calendar is None:
-                calendar = GregorianNoLeapSecond()
-            else:
-                calendar = self.calendar
-            newyear = self.year
-            newmonth = self.month
-            newday = self.day
-            if other.quantity == 'days':
-                for day in range(other.value):
-                    newday = newday - 1
-                    days_in_month = calendar.month_day_map[newmonth - 1]
-                    if (calendar.is_leap_year(newyear) and
-                       newmonth == calendar.leap_year_date.month):
-                        days_in_month -= 1
-                    if newday > days_in_month:
-                        newday = newday - days_in_month
-                        newmonth -= 1
-                        if newmonth > calendar.months_in_year:
-                            yearstep = 1
-                            if not calendar.is_valid_year(newyear + yearstep):
-                                yearstep = 2
-                                if not calendar.is_valid_year(newyear + yearstep):
-                                    msg = ('There are two adjacent skip years in '
-                                           'this calendar period: {}, {}.')
-                                    msg = msg.format(newyear+1, newyear+2)
-                                    raise ValueError(msg)
-                            newyear -= yearstep
-                            newmonth = newmonth - calendar.months_in_year
-
-            return date(newyear, newmonth, newday, self.calendar)
-
+            return self + timedelta(**{other.quantity: -other.value})
         else:
-            msg = "unsupported operand type(s) for +: '{}' and '{}'"
+            msg = "unsupported operand type(s) for -: '{}' and '{}'"
             msg = msg.format(type(self), type(other))
             raise TypeError(msg)
 
@@ -231,47 +357,27 @@ class date(object):
         newday = self.day
 
         if other.quantity == 'days':
-            for day in range(other.value):
-                newday = newday + 1
-                days_in_month = calendar.month_day_map[newmonth - 1]
-                if (calendar.is_leap_year(newyear) and
-                   newmonth == calendar.leap_year_date.month):
-                    days_in_month += 1
-                if newday > days_in_month:
-                    newday = newday - days_in_month
-                    newmonth += 1
-                    if newmonth > calendar.months_in_year:
-                        yearstep = 1
-                        if not calendar.is_valid_year(newyear + yearstep):
-                            yearstep = 2
-                            if not calendar.is_valid_year(newyear + yearstep):
-                                msg = ('There are two adjacent skip years in this '
-                                       'calendar period: {}, {}.')
-                                msg = msg.format(newyear+1, newyear+2)
-                                raise ValueError(msg)
-                        newyear += yearstep
-                        newmonth = newmonth - calendar.months_in_year
+            ordinal = calendar.date_to_ordinal(self.year, self.month, self.day)
+            newyear, newmonth, newday = calendar.ordinal_to_date(
+                ordinal + int(other.value))
         elif other.quantity == 'months':
-            for month in range(other.value):
-                newmonth += 1
-                if newmonth > calendar.months_in_year:
-                    yearstep = 1
-                    if not calendar.is_valid_year(newyear + yearstep):
-                        yearstep = 2
-                        if not calendar.is_valid_year(newyear + yearstep):
-                            msg = ('There are two adjacent skip years in this '
-                                   'calendar period: {}, {}.')
-                            msg = msg.format(newyear+1, newyear+2)
-                            raise ValueError(msg)
-                    newyear += yearstep
-                    newmonth = newmonth - calendar.months_in_year
-                
-
+            index = calendar.month_index(self.year, self.month)
+            newyear, newmonth = calendar.index_month(index + int(other.value))
         elif other.quantity == 'years':
-            newyear = newyear + other.value
+            index = calendar.year_index(self.year)
+            newyear = calendar.index_year(index + int(other.value))
+        if other.quantity in ['months', 'years']:
+            # Days beyond the end of the new month are clamped to it.
+            cumulative = calendar.cumulative_month_days(newyear)
+            newday = min(newday, cumulative[newmonth] -
+                         cumulative[newmonth - 1])
 
         return date(newyear, newmonth, newday, self.calendar)
 
+    def freeze(self):
+        """Return an immutable :class:`frozendate` of this date."""
+        return frozendate(self.year, self.month, self.day, self.calendar)
+
 
 class time(object):
     """
@@ -279,7 +385,7 @@ class time(object):
 
     Attributes: hour, minute, second, microsecond, and tzinfo.
 
-    Objects of this type are not immutable.
+    Objects of this type are not immutable, see :class:`frozentime`.
 
     """
     def __init__(self, hour=0, minute=0, second=0, microsecond=0, tzinfo=None):
@@ -342,6 +448,11 @@ class time(object):
         newtime = time(hours, minutes, seconds)
         return newtime
 
+    def freeze(self):
+        """Return an immutable :class:`frozentime` of this time."""
+        return frozentime(self.hour, self.minute, self.second,
+                          self.microsecond or 0, self.tzinfo)
+
 
 class datetime(object):
     """
@@ -351,7 +462,8 @@ class datetime(object):
     Attributes: year, month, day, hour, minute, second, microsecond,
     tzinfo and calendar.
 
-    Objects of this type are not immutable.
+    Objects of this type are not immutable, see
+    :class:`frozendatetime`.
 
     """
     def __init__(self, year, month, day, hour=0, minute=0, second=0,
@@ -518,39 +630,246 @@ class datetime(object):
             newdate = self.date + other
 
             newtime = self.time
-        elif other.quantity == 'seconds':
-            naive_days = int(other.value) // (24 * 60 * 60)
-            newdate = self.date + timedelta(days=naive_days)
-            remainder = other.value % (24 * 60 * 60)
-            for day, month, year in calendar.leapsecond_datetimes:
-                leap_second_date = date(year, month, day, calendar=calendar)
-                if leap_second_date > self.date and leap_second_date < newdate:
-                    remainder -= 1
-            newtime = self.time + timedelta(seconds=remainder)
-            if newtime.hour < 0:
-                newdate = newdate - timedelta(days=1)
-                newtime.hour += 24
-        elif other.quantity == 'minutes':
-            pass
-        elif other.quantity == 'hours':
-            naive_days = int(other.value) // 24
-            newdate = self.date + timedelta(days=naive_days)
-            remainder = other.value % 24
-            newtime = self.time + timedelta(hours=remainder)
-            if newtime.hour < 0:
-                newdate = newdate - timedelta(days=1)
-                newtime.hour += 24
-            
+        elif other.quantity in _unit_microseconds:
+            ordinal, ticks = _ordinal_ticks(self, calendar)
+            daysecond, microsecond = divmod(ticks, 1000000)
+            value = other.value
+            per_unit = _unit_microseconds[other.quantity]
+            if isinstance(value, float):
+                whole = int(value // 1)
+                microsecond += int(round((value - whole) * per_unit))
+                value = whole
+            if other.quantity == 'seconds' and calendar.leapsecond_ordinals:
+                value -= int(calendar.leapseconds_elapsed(ordinal, daysecond,
+                                                          value))
+            days, ticks = divmod(daysecond * 1000000 + microsecond +
+                                 int(value) * per_unit, 86400000000)
+            newdate = date(*calendar.ordinal_to_date(ordinal + days))
+            seconds, microsecond = divmod(ticks, 1000000)
+            minutes, seconds = divmod(seconds, 60)
+            hours, minutes = divmod(minutes, 60)
+            newtime = time(hours, minutes, seconds, microsecond, self.tzinfo)
         else:
-            raise ValueError('A timedelta with   cannot be '
-                             'added to a datetime.')
+            raise ValueError('A timedelta with {} cannot be '
+                             'added to a datetime.'.format(other.quantity))
         if result is not None:
             result = datetime(newdate.year, newdate.month, newdate.day,
                               newtime.hour, newtime.minute, newtime.second,
-                              tzinfo=newtime.tzinfo,
+                              newtime.microsecond, tzinfo=newtime.tzinfo,
                               calendar=self.calendar, tsep=self.tsep)
         return result
 
+    def freeze(self):
+        """Return an immutable :class:`frozendatetime` of this datetime."""
+        return frozendatetime(self.year, self.month, self.day, self.hour,
+                              self.minute, self.second,
+                              self.microsecond or 0, tzinfo=self.tzinfo,
+                              calendar=self.calendar, tsep=self.tsep)
+
+
+class _frozen(object):
+    """
+    The base of the immutable date, time and datetime types, which are
+    compared, ordered and hashed by an integer key computed once, when they
+    are created.
+
+    """
+    __slots__ = ('_key',)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('{} objects are immutable.'.format(
+            type(self).__name__))
+
+    def __delattr__(self, name):
+        raise AttributeError('{} objects are immutable.'.format(
+            type(self).__name__))
+
+    def _set(self, **attributes):
+        for name, value in attributes.items():
+            object.__setattr__(self, name, value)
+
+    def _other_key(self, other, operator):
+        # Calendars are usually shared instances, so are checked by
+        # identity before equality.
+        if (other.__class__ is self.__class__ and
+                other.calendar is self.calendar):
+            return other._key
+        if type(other) is not type(self):
+            msg = "unsupported operand type(s) for {}: '{}' and '{}'"
+            msg = msg.format(operator, type(self), type(other))
+            raise TypeError(msg)
+        if not self.calendar == other.calendar:
+            raise NotImplementedError('{} != {}'.format(self.calendar,
+                                                        other.calendar))
+        return other._key
+
+    def __lt__(self, other):
+        return self._key < self._other_key(other, '<')
+
+    def __le__(self, other):
+        return self._key <= self._other_key(other, '<=')
+
+    def __gt__(self, other):
+        return self._key > self._other_key(other, '>')
+
+    def __ge__(self, other):
+        return self._key >= self._other_key(other, '>=')
+
+    def __eq__(self, other):
+        # Other types and calendars are unequal, rather than an error, so
+        # that these may share dictionaries and sets with other objects;
+        # only ordering across calendars is undefined.
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        if (other.calendar is not self.calendar and
+                not self.calendar == other.calendar):
+            return False
+        return self._key == other._key
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is not NotImplemented:
+            result = not result
+        return result
+
+    def __hash__(self):
+        return hash(self._key)
+
+    def __str__(self):
+        return str(self.thaw())
+
+    def __repr__(self):
+        return 'terra.datetime.{}({})'.format(type(self).__name__, str(self))
+
+    def __add__(self, other):
+        return (self.thaw() + other).freeze()
+
+    def __sub__(self, other):
+        result = self.thaw() - (other.thaw() if isinstance(other, _frozen)
+                                else other)
+        if isinstance(result, (date, time, datetime)):
+            result = result.freeze()
+        return result
+
+
+class frozendate(_frozen):
+    """
+    An immutable, hashable :class:`terra.datetime.date`.
+
+    Attributes: year, month, day and calendar.
+
+    """
+    __slots__ = ('year', 'month', 'day', 'calendar')
+
+    def __init__(self, year, month, day, calendar=None):
+        if calendar is not None:
+            month = calendar._month_numbers.get(month, month)
+        key = (calendar or GregorianNoLeapSecond()).date_to_ordinal(
+            year, month, day)
+        self._set(year=year, month=month, day=day, calendar=calendar,
+                  _key=key)
+
+    def __reduce__(self):
+        return (type(self), (self.year, self.month, self.day, self.calendar))
+
+    def thaw(self):
+        """Return a mutable :class:`terra.datetime.date` of this date."""
+        return date(self.year, self.month, self.day, self.calendar)
+
+
+class frozentime(_frozen):
+    """
+    An immutable, hashable :class:`terra.datetime.time`.
+
+    Attributes: hour, minute, second, microsecond and tzinfo.  Float
+    seconds are held as whole seconds and microseconds.
+
+    """
+    __slots__ = ('hour', 'minute', 'second', 'microsecond', 'tzinfo')
+
+    # Times are independent of any calendar.
+    calendar = None
+
+    def __init__(self, hour=0, minute=0, second=0, microsecond=0,
+                 tzinfo=None):
+        if isinstance(second, float):
+            if microsecond != 0:
+                raise ValueError('float seconds and microseconds cannot'
+                                 ' both be specified')
+            # Rounding may carry a whole second.
+            second, microsecond = divmod(int(round(second * 1e6)), 1000000)
+        key = ((hour * 60 + minute) * 60 + second) * 1000000 + microsecond
+        self._set(hour=hour, minute=minute, second=second,
+                  microsecond=microsecond, tzinfo=tzinfo, _key=key)
+
+    def __reduce__(self):
+        return (type(self), (self.hour, self.minute, self.second,
+                             self.microsecond, self.tzinfo))
+
+    def thaw(self):
+        """Return a mutable :class:`terra.datetime.time` of this time."""
+        return time(self.hour, self.minute, self.second, self.microsecond,
+                    self.tzinfo)
+
+
+class frozendatetime(_frozen):
+    """
+    An immutable, hashable :class:`terra.datetime.datetime`.
+
+    Attributes: year, month, day, hour, minute, second, microsecond,
+    tzinfo, calendar and tsep.  Float seconds are held as whole seconds and
+    microseconds.
+
+    The key, in microseconds from the start of day ordinal 0 of the
+    calendar ignoring leap seconds, makes sorting, bisecting and
+    de-duplicating lists of frozendatetimes integer operations.
+
+    """
+    __slots__ = ('year', 'month', 'day', 'hour', 'minute', 'second',
+                 'microsecond', 'tzinfo', 'calendar', 'tsep')
+
+    def __init__(self, year, month, day, hour=0, minute=0, second=0,
+                 microsecond=0, tzinfo=None, calendar=None, tsep='T'):
+        if calendar is not None:
+            month = calendar._month_numbers.get(month, month)
+        if isinstance(second, float):
+            if microsecond != 0:
+                raise ValueError('float seconds and microseconds cannot'
+                                 ' both be specified')
+            # Rounding may carry a whole second.
+            second, microsecond = divmod(int(round(second * 1e6)), 1000000)
+        ordinal = (calendar or GregorianNoLeapSecond()).date_to_ordinal(
+            year, month, day)
+        ticks = ((hour * 60 + minute) * 60 + second) * 1000000 + microsecond
+        self._set(year=year, month=month, day=day, hour=hour, minute=minute,
+                  second=second, microsecond=microsecond, tzinfo=tzinfo,
+                  calendar=calendar, tsep=tsep,
+                  _key=ordinal * 86400000000 + ticks)
+
+    def __reduce__(self):
+        return (type(self), (self.year, self.month, self.day, self.hour,
+                             self.minute, self.second, self.microsecond,
+                             self.tzinfo, self.calendar, self.tsep))
+
+    @property
+    def date(self):
+        return frozendate(self.year, self.month, self.day, self.calendar)
+
+    @property
+    def time(self):
+        return frozentime(self.hour, self.minute, self.second,
+                          self.microsecond, self.tzinfo)
+
+    def thaw(self):
+        """
+        Return a mutable :class:`terra.datetime.datetime` of this datetime.
+
+        """
+        return datetime(self.year, self.month, self.day, self.hour,
+                        self.minute, self.second, self.microsecond,
+                        tzinfo=self.tzinfo, calendar=self.calendar,
+                        tsep=self.tsep)
+
 
 def convert_datetimes(datetimes):
     """
@@ -628,57 +947,21 @@ class CalendarDuration(object):
     #         result = self.end.year - self.start.year
     #     return result
 
+    def _ordinal(self, adate):
+        return self.calendar.date_to_ordinal(adate.year, adate.month,
+                                             adate.day)
+
     @property
     def days(self):
-        """Return the floor of the number of days."""
-        def _add_day(adate, days):
-            adate = adate + timedelta(days=1)
-            days += 1
-            if (self.calendar.is_leap_year(adate.year) and
-               adate.month == self.calendar.leap_year_date.month and
-               adate.day == (self.calendar.leap_year_date.day - 1)):
-                days += 1
-                adate = adate + timedelta(days=1)
-            return adate, days
+        """
+        Return the number of days between the start date and the end date,
+        ignoring any time of day.
 
+        """
         if self.start.day is None or self.end.day is None:
             result = None
         else:
-            # Accumulate to calculate
-            adate = copy.copy(self.start)
-            days = 0
-            if (self.start.year == self.end.year and
-               self.start.month == self.end.month):
-                for d in range(self.start.day, self.end.day):
-                    adate, days = _add_day(adate, days)
-            else:
-                # Handle the first month, which may be partial.
-                mlen = self.calendar.month_day_map[self.start.month - 1]
-                for d in range(mlen)[self.start.day:]:
-                    adate, days = _add_day(adate, days)
-                if self.end.year == self.start.year:
-                    if self.end.month - self.start.month > 1:
-                        for month_length in self.calendar.month_day_map[self.start.month:self.end.month - 1]:
-                            for d in range(month_length):
-                                adate, days = _add_day(adate, days)
-                else:
-                    # handle up to the end of the first year.
-                    for month_length in self.calendar.month_day_map[self.start.month:]:
-                        for d in range(month_length):
-                            adate, days = _add_day(adate, days)
-                    # Handle all the middle (full) years.
-                    for year in range(self.end.year - self.start.year - 1):
-                        for month_length in self.calendar.month_day_map:
-                            for d in range(month_length):
-                                adate, days = _add_day(adate, days)
-                    # Handle the last year, which may be partial.
-                    for month_length in self.calendar.month_day_map[:self.end.month - 1]:
-                        for d in range(month_length):
-                            adate, days = _add_day(adate, days)
-                # Handle the last month, which may be partial.
-                for d in range(self.calendar.month_day_map[self.end.month])[:self.end.day]:
-                    adate, days = _add_day(adate, days)
-            result = days
+            result = self._ordinal(self.end) - self._ordinal(self.start)
         return result
 
     def total_hours(self):
@@ -699,22 +982,24 @@ class CalendarDuration(object):
 
     @property
     def seconds(self):
+        """
+        Return the number of whole seconds, including any leap seconds
+        which occur within the period.
+
+        """
         if self.start.second is None or self.end.second is None:
             result = None
         else:
             seconds = self.end.second - self.start.second
             result = self.total_minutes() * 60 + seconds
-        if False:
-            # handle leap seconds if they exist within the period
-            leapseconds = 0
-            result += 1 * leapseconds
-
+            result += self.calendar.count_leapseconds(
+                self._ordinal(self.start), self._ordinal(self.end))
         return result
 
     def total_seconds(self):
-        tsec = self.seconds
-        if tsec is not None and self.microseconds is not None:
-            result = self.seconds + self.microseconds
+        result = self.seconds
+        if result is not None and self.microseconds is not None:
+            result = result + self.microseconds / 1e6
         return result
 
     @property
@@ -762,6 +1047,121 @@ class timedelta(object):
         return None
 
 
+class TimedeltaArray(object):
+    """
+    An array of durations, stored as int64 columns of years, months,
+    days, seconds and microseconds, each of which may vary independently.
+
+    Added to a :class:`DatetimeArray`, the columns are applied as a chain
+    of scalar :class:`timedelta` additions would be: years, then months,
+    clamping days beyond the end of the resulting month, then days, then
+    the time of day.  Seconds are elapsed seconds, so count the leap
+    seconds of the calendar; hours, minutes and microseconds are clock
+    time and do not.
+
+    """
+    _columns = ('years', 'months', 'days', 'seconds', 'microseconds')
+
+    def __init__(self, years=0, months=0, days=0, hours=0, minutes=0,
+                 seconds=0, microseconds=0, mask=None):
+        """
+        Create a TimedeltaArray from integer arrays, or scalars, of each
+        quantity, which are broadcast together.
+
+        Kwargs:
+
+            * years, months, days, hours, minutes, seconds, microseconds -
+              the quantities of each duration.
+            * mask - a boolean array, True for missing durations.
+
+        """
+        clock = ((np.asarray(hours, dtype=np.int64) * 60 + minutes) *
+                 60000000 + np.asarray(microseconds, dtype=np.int64))
+        columns = [np.asarray(column, dtype=np.int64) for column in
+                   (years, months, days, seconds, clock)]
+        columns = np.broadcast_arrays(*columns)
+        for name, column in zip(self._columns, columns):
+            setattr(self, name, np.array(column))
+        if mask is None or mask is np.ma.nomask:
+            mask = np.ma.nomask
+        else:
+            mask = np.broadcast_to(np.asarray(mask, dtype=bool),
+                                   self.shape).copy()
+        self.mask = mask
+
+    @classmethod
+    def from_timedelta(cls, atimedelta):
+        """Create a 0-dimensional TimedeltaArray from a timedelta."""
+        if atimedelta.value is None:
+            return cls(mask=True)
+        if not isinstance(atimedelta.value, (six.integer_types, np.integer)):
+            raise TypeError('Only integer timedeltas may be converted to a '
+                            'TimedeltaArray, not {!r}.'.format(
+                                atimedelta.value))
+        return cls(**{atimedelta.quantity: atimedelta.value})
+
+    @property
+    def shape(self):
+        return self.days.shape
+
+    @property
+    def ndim(self):
+        return self.days.ndim
+
+    @property
+    def size(self):
+        return self.days.size
+
+    def __len__(self):
+        return len(self.days)
+
+    def _new(self, columns, mask):
+        result = object.__new__(TimedeltaArray)
+        for name, column in zip(self._columns,
+                                np.broadcast_arrays(*columns)):
+            setattr(result, name, np.array(column))
+        if mask is not np.ma.nomask:
+            mask = np.broadcast_to(np.asarray(mask, dtype=bool),
+                                   result.shape).copy()
+        result.mask = mask
+        return result
+
+    def __getitem__(self, index):
+        mask = self.mask
+        if mask is not np.ma.nomask:
+            mask = np.asarray(mask[index])
+        return self._new([np.asarray(getattr(self, name)[index])
+                          for name in self._columns], mask)
+
+    def __neg__(self):
+        return self._new([-getattr(self, name) for name in self._columns],
+                         self.mask)
+
+    def __add__(self, other):
+        if isinstance(other, timedelta):
+            other = TimedeltaArray.from_timedelta(other)
+        if not isinstance(other, TimedeltaArray):
+            return NotImplemented
+        columns = [getattr(self, name) + getattr(other, name)
+                   for name in self._columns]
+        return self._new(columns, np.ma.mask_or(self.mask, other.mask))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, timedelta):
+            other = TimedeltaArray.from_timedelta(other)
+        if not isinstance(other, TimedeltaArray):
+            return NotImplemented
+        return self + -other
+
+    def __repr__(self):
+        quantities = ', '.join('{}={}'.format(name, getattr(self, name))
+                               for name in self._columns
+                               if np.any(getattr(self, name)))
+        return 'TimedeltaArray({})'.format(quantities)
+
+
 # class DateDuration(Duration):
 #     """
 #     A datetime duration, represented by whole unit like quantities.
@@ -864,6 +1264,15 @@ class EpochDateTimes(object):
         return self.epoch.calendar
 
     def __str__(self):
+        offsets = self.offsets.offsets
+        edgeitems = np.get_printoptions()['edgeitems']
+        if offsets.size > np.get_printoptions()['threshold']:
+            # Only the displayed elements are converted.
+            index = np.ix_(*[_edge_indices(length, edgeitems)
+                             for length in offsets.shape])
+            block = EpochDateTimes(offsets[index], self.offsets.unit,
+                                   self.epoch)
+            return _summarize(block.datetimes(), offsets.shape, edgeitems)
         dts = self.datetimes()
         result = str(dts)
         if not self.offsets.offsets.shape or len(dts) == 1:
@@ -871,119 +1280,2030 @@ class EpochDateTimes(object):
                 result = str(dts[0])
         return result
 
-    def datetimes(self):
+    @property
+    def shape(self):
+        return self.offsets.offsets.shape
+
+    @property
+    def ndim(self):
+        return self.offsets.offsets.ndim
+
+    @property
+    def size(self):
+        return self.offsets.offsets.size
+
+    def __len__(self):
+        return len(self.offsets.offsets)
+
+    def __getitem__(self, index):
         """
-        Return an array of terra.datetime.datetime objects,
-        or the offsets array if there are problems with deriving
-        datetimes.
+        Return the EpochDateTimes of the indexed offsets, or the
+        :class:`datetime` of a single offset, converting only the indexed
+        offsets.
+
         """
-        if not self.offsets.offsets.shape:
-            offsets = self.offsets.offsets.reshape((1,))
-        else:
-            offsets = self.offsets.offsets
-        if np.issubdtype(self.offsets.offsets.dtype, np.integer):
-            result = np.array([str(self.epoch +
-                                   timedelta(**{self.offsets.unit.unit: v}))
-                               for v in offsets])
+        offsets = self.offsets.offsets[index]
+        if np.ndim(offsets):
+            result = EpochDateTimes(offsets, self.offsets.unit, self.epoch)
+        elif offsets is np.ma.masked:
+            result = np.ma.masked
         else:
-            result = self.offsets.offsets
+            sample = EpochDateTimes(np.array([offsets]), self.offsets.unit,
+                                    self.epoch)
+            result = sample.datetime_array()[0]
         return result
 
-    def __repr__(self):
-        return self.__str__()
+    def iter_chunks(self, chunk_size=1048576, out=None, kind='U'):
+        """
+        Generate the ISO formatted datetimes of successive chunks of at
+        most chunk_size offsets, in the order of the flattened offsets.
 
+        Only one chunk is converted at a time, so the memory used is
+        bounded by the chunk size; the offsets may be a :class:`np.memmap`.
 
-class Calendar(object):
-    """
-    A representation of the relationship between the different elements
-    of a potential datetime instance.
+        Kwargs:
 
-    This includes the definition of periodic and nested
-    unit like quantities.
+            * chunk_size - the number of offsets in each chunk.
+            * out - a C contiguous S or U array, such as a
+                    :class:`np.memmap`, with an element for each offset.
+                    Each chunk is written into out, and the chunks
+                    generated are views of out.
+            * kind - 'U' for unicode or 'S' for bytes strings, ignored if
+                     out is given.
 
-    """
-    def __init__(self, url=None,
-                 leap_year_date=None,
-                 month_names=None,
-                 month_day_map=None, leapsecond_datetimes=None,
-                 weekday_names=None,
-                 weekday_start_date=None, null_years=None):
-        self.url = url
-        self.leap_year_date = leap_year_date
-        if month_names is None:
-            month_names = []
-        self.month_names = month_names
-        if len(month_names) != len(month_day_map):
-            raise ValueError('month names:\n{}\nis not the same length as '
-                             'month_day_map:\n'
-                             '{}\n'.format(month_names, month_day_map))
-        self.month_day_map = month_day_map
-        if leapsecond_datetimes is None:
-            leapsecond_datetimes = []
-        self.leapsecond_datetimes = leapsecond_datetimes
-        if weekday_names is None:
-            weekday_names = []
-        self.weekday_names = weekday_names
-        self.weekday_start_date = weekday_start_date
-        if null_years is None:
-            null_years = []
-        self.null_years = null_years
+        """
+        out = self._flat_out(out)
+        for start, stop, chunk in self._chunks(chunk_size):
+            target = None if out is None else out[start:stop]
+            if chunk._vectorizable():
+                result = chunk.datetime_array().strings(kind, out=target)
+            else:
+                result = chunk.datetimes()
+                if target is not None:
+                    if result.dtype.itemsize > target.dtype.itemsize:
+                        raise ValueError('out is too narrow for {} '
+                                         'strings.'.format(result.dtype))
+                    target[:] = result
+                    result = target
+            yield result
+
+    def _chunks(self, chunk_size):
+        # Generate the start, stop and EpochDateTimes of successive chunks
+        # of the flattened offsets.
+        offsets = self.offsets.offsets.reshape(-1)
+        for start in range(0, offsets.size, chunk_size):
+            stop = min(start + chunk_size, offsets.size)
+            yield (start, stop, EpochDateTimes(offsets[start:stop],
+                                               self.offsets.unit, self.epoch))
+
+    def _flat_out(self, out):
+        # Return a flat view of an output array for the offsets.
+        if out is not None:
+            if not out.flags.c_contiguous or out.size != self.size:
+                raise ValueError('out must be a C contiguous array of {} '
+                                 'elements.'.format(self.size))
+            out = out.reshape(-1)
+        return out
+
+    @classmethod
+    def from_file(cls, filename, unit, epoch, dtype=np.int64, shape=None,
+                  offset=0):
+        """
+        Create an EpochDateTimes of offsets memory mapped, read only, from
+        a raw binary file, so the offsets are read from disk as they are
+        converted rather than all loaded into memory.
 
-    def is_leap_year(self, year):
-        """Return True for leap years, False for non-leap years."""
-        return False
+        Args:
 
-    @property
-    def days_in_week(self):
-        return len(self.weekday_names)
+            * filename - the file of offsets.
+            * unit - the temporal unit of the offsets.
+            * epoch - a :class:`terra.datetime.datetime` instance.
 
-    @property
-    def months_in_year(self):
-        return len(self.month_names)
+        Kwargs:
 
-    @property
-    def days_in_year(self):
-        return sum(self.month_day_map)
+            * dtype - the data type of the offsets in the file.
+            * shape - the shape of the offsets, defaults to all of the
+                      offsets in the file from offset.
+            * offset - the position of the offsets in the file, in bytes.
 
-    @property
-    def days_in_leap_year(self):
-        return None
+        """
+        offsets = np.memmap(filename, dtype=dtype, mode='r', shape=shape,
+                            offset=offset)
+        return cls(offsets, unit, epoch)
 
-    def is_valid_year(self, year):
-        result = True
-        if year in self.null_years:
-            result = False
-        return result
+    def write_strings(self, filename, chunk_size=1048576, kind='S',
+                      width=26, workers=None):
+        """
+        Write the ISO formatted datetimes to a new memory mapped file of
+        fixed width strings, one chunk at a time, and return the
+        :class:`np.memmap`.
 
-    def __eq__(self, other):
-        return isinstance(self, type(other))
+        Masked offsets are written as empty strings.
+        See :meth:`iter_chunks`.
 
-    def __ne__(self, other):
-        return not self.__eq__(other)
+        Kwargs:
 
+            * workers - the number of processes to convert chunks of the
+                        offsets in, each writing to the file, see
+                        :meth:`convert_in_processes`.  Defaults to
+                        converting in this process, as do versions of
+                        Python before 3.8.
 
-class G360Day(Calendar):
-    def __init__(self):
-        url = None
-        month_names = ['January', 'February', 'March', 'April', 'May', 'June',
-                       'July', 'August', 'September', 'October', 'November',
-                       'December']
-        month_day_map = [30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30]
+        """
+        out = np.memmap(filename, dtype='{}{}'.format(kind, width),
+                        mode='w+', shape=self.shape)
+        if workers is not None and workers > 1 and self._parallelizable():
+            out.flush()
+            self.convert_in_processes(workers, chunk_size, out=filename,
+                                      kind=kind, width=width)
+        else:
+            for chunk in self.iter_chunks(chunk_size, out=out):
+                pass
+            out.flush()
+        return out
+
+    def _parallelizable(self):
+        # Any non-empty axis which datetimes converts to strings, where
+        # shared memory is available.
+        return (sys.version_info >= (3, 8) and self.size > 0 and
+                (self._vectorizable() or
+                 np.issubdtype(self.offsets.offsets.dtype, np.integer)))
+
+    def convert_in_processes(self, workers, chunk_size=None, out=None,
+                             kind='U', width=26):
+        """
+        Convert and format chunks of the flattened offsets in a pool of
+        worker processes.
 
-        # leapsecond_datetimes = None
-        # weekday_names = None
-        # weekday_start_date = None
-        # null_years = None
-        super(G360Day, self).__init__(url, month_names=month_names,
-                                      month_day_map=month_day_map)
+        Each worker converts its chunks as :meth:`datetimes` would, on
+        the vectorized path where it applies, so the processes share the
+        whole conversion and formatting.  Starting the pool and copying
+        the offsets cost a fixed time, so this only pays off for large
+        axes on machines with several cores.
 
+        The offsets, and any mask, are copied once into shared memory,
+        each worker formats its chunks into a shared output array, and
+        the result is assembled in order.  The calendar of the epoch must
+        be importable by the workers, which use the leap second table of
+        this process, see :func:`leap_seconds`.
 
-class G365Day(Calendar):
-    def __init__(self):
-        url = None
-        month_names = ['January', 'February', 'March', 'April', 'May', 'June',
-                       'July', 'August', 'September', 'October', 'November',
-                       'December']
+        Args:
+
+            * workers - the number of worker processes.
+
+        Kwargs:
+
+            * chunk_size - the number of offsets in each chunk, defaults
+                           to an eighth of the offsets for each worker.
+            * out - the name of an existing file of flattened, fixed
+                    width strings of the given kind and width to write
+                    to, as made by :meth:`write_strings`.  Defaults to a
+                    new shared memory array.
+            * kind - 'U' for unicode or 'S' for bytes strings.
+            * width - the fixed width of each string; ValueError is
+                      raised for longer strings.
+
+        Returns a flat array of strings, masked if the offsets are
+        masked, or None if out is given.
+
+        Raises NotImplementedError before Python 3.8.
+
+        """
+        if sys.version_info < (3, 8):
+            raise NotImplementedError('Converting in processes requires '
+                                      'Python 3.8 or later.')
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import shared_memory
+
+        size = self.size
+        if chunk_size is None:
+            chunk_size = max(-(-size // (workers * 8)), 1)
+        mask = self.mask
+        dtype = np.dtype('{}{}'.format(kind, width))
+        blocks = []
+
+        def share(array):
+            block = shared_memory.SharedMemory(create=True,
+                                               size=max(array.nbytes, 1))
+            blocks.append(block)
+            shared = np.ndarray(array.shape, array.dtype, buffer=block.buf)
+            if array.size:
+                shared[...] = array
+            del shared
+            return ('shared', block.name, array.shape, array.dtype.str)
+
+        try:
+            offsets = np.ma.getdata(self.offsets.offsets).reshape(-1)
+            source = share(offsets)
+            mask_source = None
+            if mask is not np.ma.nomask:
+                mask_source = share(mask.reshape(-1))
+            if out is None:
+                target = share(np.zeros(size, dtype=dtype))
+            else:
+                target = ('file', out, (size,), dtype.str)
+            with ProcessPoolExecutor(max_workers=workers,
+                                     initializer=_use_leap_seconds,
+                                     initargs=(leap_seconds(),)) as executor:
+                futures = [executor.submit(_convert_shared, source,
+                                           mask_source, target, start,
+                                           min(start + chunk_size, size),
+                                           self.offsets.unit.unit,
+                                           self.epoch)
+                           for start in range(0, size, chunk_size)]
+                for future in futures:
+                    future.result()
+            result = None
+            if out is None:
+                result, handle = _attach(target)
+                result = np.array(result)
+                handle.close()
+                # The narrowest width which holds every string.
+                longest = 0
+                if size:
+                    longest = int(np.char.str_len(result).max())
+                result = result.astype('{}{}'.format(kind, max(longest, 1)))
+                if mask is not np.ma.nomask:
+                    result = np.ma.masked_array(result,
+                                                mask=mask.reshape(-1))
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+        return result
+
+    def write_components(self, filename, chunk_size=1048576):
+        """
+        Write the year, month, day, hour, minute, second and microsecond
+        of each offset to a new memory mapped file of
+        :data:`component_dtype` records, one chunk at a time, and return
+        the :class:`np.memmap`.
+
+        Masked offsets are written as zeros.
+
+        """
+        out = np.memmap(filename, dtype=component_dtype, mode='w+',
+                        shape=self.shape)
+        flat = self._flat_out(out)
+        for start, stop, chunk in self._chunks(chunk_size):
+            for name, component in zip(component_dtype.names,
+                                       chunk.components()):
+                flat[name][start:stop] = np.ma.filled(component, 0)
+        out.flush()
+        return out
+
+    def __iter__(self):
+        if self.ndim == 1:
+            # Convert blocks of offsets, to bound the memory used.
+            for start in range(0, len(self), _iteration_block):
+                block = self[start:start + _iteration_block]
+                for item in block.datetime_array():
+                    yield item
+        else:
+            for i in range(len(self)):
+                yield self[i]
+
+    @property
+    def mask(self):
+        """
+        The boolean mask array of masked, and non-finite float, offsets,
+        or numpy.ma.nomask.
+
+        """
+        offsets = self.offsets.offsets
+        mask = np.ma.getmask(offsets)
+        if np.issubdtype(offsets.dtype, np.floating):
+            finite = np.isfinite(np.ma.getdata(offsets))
+            if not finite.all():
+                mask = np.ma.getmaskarray(offsets) | ~finite
+        return mask
+
+    def _vectorizable(self):
+        dtype = self.offsets.offsets.dtype
+        unit = self.offsets.unit.unit
+        return (np.issubdtype(dtype, np.integer) and
+                unit in ['days', 'hours', 'minutes', 'seconds', 'months',
+                         'years'] or
+                np.issubdtype(dtype, np.floating) and
+                unit in ['days', 'hours', 'minutes', 'seconds'])
+
+    def ordinals_ticks(self):
+        """
+        Return int64 arrays of the calendar day ordinals and the
+        microseconds into each day of the offsets.
+
+        Masked offsets are given as the epoch, see :attr:`mask`.
+
+        Float offsets are split into whole units and a remainder, which is
+        rounded to the nearest microsecond.  Splitting is exact, so the
+        result is within half a microsecond of the instant of the binary
+        value of each offset; the float64 value itself may differ from the
+        intended offset by up to abs(offset) * 2**-53 units, which is below
+        a microsecond for 'days since' offsets within +/- 50000 years.
+
+        Integer month and year offsets move the epoch by whole calendar
+        months or years, skipping null years; days beyond the end of the
+        resulting month are clamped to its last day.
+
+        """
+        calendar = self.calendar
+        if calendar is None:
+            calendar = GregorianNoLeapSecond()
+        unit = self.offsets.unit.unit
+        if unit in ['months', 'years']:
+            return self._calendar_ordinals_ticks(calendar)
+        per_unit = _unit_microseconds.get(unit, 86400000000)
+        offsets = np.ma.getdata(self.offsets.offsets)
+        mask = self.mask
+        if mask is not np.ma.nomask:
+            offsets = np.where(mask, 0, offsets)
+        if np.issubdtype(offsets.dtype, np.floating):
+            whole = np.floor(offsets)
+            fraction = np.rint((offsets - whole) * per_unit).astype(np.int64)
+            offsets = whole.astype(np.int64)
+        else:
+            offsets = np.asarray(offsets, dtype=np.int64)
+            fraction = np.zeros(offsets.shape, dtype=np.int64)
+        epoch_ordinal, epoch_ticks = _ordinal_ticks(self.epoch, calendar)
+        epoch_second = epoch_ticks // 1000000
+        if unit == 'days':
+            carry, ticks = np.divmod(fraction + epoch_ticks, 86400000000)
+            ordinals = offsets + carry + epoch_ordinal
+        elif unit in _unit_microseconds:
+            if unit == 'seconds' and calendar.leapsecond_datetimes:
+                offsets = offsets - calendar.leapseconds_elapsed(
+                    epoch_ordinal, epoch_second, offsets)
+            days, remainder = np.divmod(offsets, 86400000000 // per_unit)
+            carry, ticks = np.divmod(remainder * per_unit + fraction +
+                                     epoch_ticks, 86400000000)
+            ordinals = days + carry + epoch_ordinal
+        else:
+            raise ValueError('{} offsets cannot be converted to day '
+                             'ordinals.'.format(unit))
+        return ordinals, ticks
+
+    def _calendar_ordinals_ticks(self, calendar):
+        # Return the day ordinals and ticks of integer month or year
+        # offsets, by divmod of month indices on the months in the year.
+        offsets = self.offsets.offsets
+        if not np.issubdtype(offsets.dtype, np.integer):
+            raise ValueError('{} offsets must be integers, results are '
+                             'ambiguous.'.format(self.offsets.unit.unit))
+        offsets = np.ma.getdata(offsets)
+        if self.mask is not np.ma.nomask:
+            offsets = np.where(self.mask, 0, offsets)
+        offsets = np.asarray(offsets, dtype=np.int64)
+        epoch = self.epoch
+        if self.offsets.unit.unit == 'months':
+            indices = calendar.month_index(epoch.year, epoch.month) + offsets
+            year_indices, months = np.divmod(indices,
+                                             calendar.months_in_year)
+            months += 1
+        else:
+            year_indices = calendar.year_index(epoch.year) + offsets
+            months = np.full(offsets.shape, epoch.month, dtype=np.int64)
+        # Tables of the start and leap year flag of each year spanned,
+        # gathered for each offset.
+        first = year_indices.min() if year_indices.size else 0
+        span = calendar.index_years(np.arange(first, year_indices.max() + 1
+                                              if year_indices.size else 0))
+        positions = year_indices - first
+        starts = calendar.days_before_year(span)[positions]
+        leap = calendar.leap_year_mask(span).astype(np.intp)[positions]
+        cumulative = calendar._cumulative_days_array
+        before = cumulative[leap, months - 1]
+        days = np.minimum(epoch.day, cumulative[leap, months] - before)
+        ordinals = starts + before + days - 1
+        epoch_ticks = _ordinal_ticks(epoch, calendar)[1]
+        ticks = np.full(offsets.shape, epoch_ticks, dtype=np.int64)
+        return ordinals, ticks
+
+    def _elapsed_microseconds(self, adatetime):
+        # Return the microseconds from the epoch to a datetime, including
+        # leap seconds for offsets in seconds, and the microseconds of
+        # the offset unit.
+        calendar = self.calendar
+        if calendar is None:
+            calendar = GregorianNoLeapSecond()
+        other = adatetime.calendar
+        if not calendar == (other if other is not None else
+                            GregorianNoLeapSecond()):
+            raise NotImplementedError('{} != {}'.format(calendar, other))
+        unit = self.offsets.unit.unit
+        if unit != 'days' and unit not in _unit_microseconds:
+            raise ValueError('{} offsets cannot be searched.'.format(unit))
+        per_unit = _unit_microseconds.get(unit, 86400000000)
+        epoch_ordinal, epoch_ticks = _ordinal_ticks(self.epoch, calendar)
+        ordinal, ticks = _ordinal_ticks(adatetime, calendar)
+        result = (ordinal - epoch_ordinal) * 86400000000 + ticks - epoch_ticks
+        if unit == 'seconds':
+            result += calendar.count_leapseconds(epoch_ordinal,
+                                                 ordinal) * 1000000
+        return result, per_unit
+
+    def searchsorted(self, adatetime, side='left'):
+        """
+        Return the index at which a datetime would be inserted into the
+        sorted 1-d offsets to keep them in order, as numpy.searchsorted.
+
+        The datetime is converted to an offset from the epoch once, and
+        the offsets are binary searched without being converted.
+
+        """
+        elapsed, per_unit = self._elapsed_microseconds(adatetime)
+        offsets = np.ma.getdata(self.offsets.offsets)
+        if np.issubdtype(offsets.dtype, np.integer):
+            # The integer offset bounding the exact, fractional offset.
+            if side == 'left':
+                value = -(-elapsed // per_unit)
+            else:
+                value = elapsed // per_unit
+            info = np.iinfo(offsets.dtype)
+            value = min(max(value, int(info.min)), int(info.max))
+        else:
+            value = elapsed / float(per_unit)
+        return int(np.searchsorted(offsets, value, side=side))
+
+    def select(self, start=None, end=None):
+        """
+        Return the EpochDateTimes of the sorted 1-d offsets from the start
+        datetime up to, but excluding, the end datetime, by binary search.
+        Either bound may be None, for no bound.
+
+        """
+        first = 0 if start is None else self.searchsorted(start)
+        last = len(self) if end is None else self.searchsorted(end)
+        return self[first:last]
+
+    def rebase(self, epoch, unit, dtype=None):
+        """
+        Re-express the offsets against a new epoch and temporal unit, in
+        the same calendar, with integer array arithmetic.
+
+        Integer offsets give integer offsets, the floor of the exact new
+        offset; float offsets give float64 offsets.
+
+        Args:
+
+            * epoch - a :class:`terra.datetime.datetime` instance.
+            * unit - the temporal unit of the new offsets: days, hours,
+                     minutes or seconds.
+
+        Kwargs:
+
+            * dtype - the data type of the new offsets, defaults to int64
+                      or float64.
+
+        Returns the new EpochDateTimes and a boolean array which is True
+        where a new offset is inexact, that is where the instant is not
+        a whole number of the new units from the new epoch.
+
+        Raises OverflowError if the new offsets, or the microseconds
+        computed on the way, are out of range.
+
+        """
+        calendar = self.calendar
+        if calendar is None:
+            calendar = GregorianNoLeapSecond()
+        if not isinstance(unit, terra.units.TemporalUnit):
+            unit = terra.units.TemporalUnit(unit)
+        old_unit = self.offsets.unit.unit
+        for name in [old_unit, unit.unit]:
+            if name != 'days' and name not in _unit_microseconds:
+                raise ValueError('{} offsets cannot be rebased.'.format(name))
+        old_per_unit = _unit_microseconds.get(old_unit, 86400000000)
+        target = EpochDateTimes(np.zeros(0, dtype=np.int64), unit, epoch)
+        mask = self.mask
+        offsets = np.ma.getdata(self.offsets.offsets)
+        if mask is not np.ma.nomask:
+            offsets = np.where(mask, 0, offsets)
+        is_integer = np.issubdtype(offsets.dtype, np.integer)
+        leap_seconds = (calendar.leapsecond_ordinals and
+                        'seconds' in [old_unit, unit.unit])
+        if is_integer and (old_unit == unit.unit or not leap_seconds):
+            # The offsets are shifted by the elapsed time between epochs.
+            shift, per_unit = target._elapsed_microseconds(self.epoch)
+            _check_int64_range(offsets, old_per_unit, shift)
+            total = offsets.astype(np.int64) * old_per_unit + shift
+        else:
+            ordinals, ticks = self.ordinals_ticks()
+            epoch_ordinal, epoch_ticks = _ordinal_ticks(epoch, calendar)
+            per_unit = _unit_microseconds.get(unit.unit, 86400000000)
+            _check_int64_range(ordinals - epoch_ordinal, 86400000000,
+                               86400000000)
+            total = ((ordinals - epoch_ordinal) * 86400000000 +
+                     ticks - epoch_ticks)
+            if unit.unit == 'seconds' and calendar.leapsecond_ordinals:
+                leaps = (np.searchsorted(calendar._leapsecond_array,
+                                         ordinals, side='right') -
+                         bisect.bisect_right(calendar.leapsecond_ordinals,
+                                             epoch_ordinal))
+                total = total + leaps * 1000000
+        if is_integer:
+            result, remainder = np.divmod(total, per_unit)
+            inexact = remainder != 0
+        else:
+            result = total / float(per_unit)
+            inexact = np.rint(result * per_unit) != total
+        if dtype is not None:
+            dtype = np.dtype(dtype)
+            if np.issubdtype(dtype, np.integer) and result.size:
+                info = np.iinfo(dtype)
+                if result.min() < info.min or result.max() > info.max:
+                    raise OverflowError('The rebased offsets are out of the '
+                                        'range of {}.'.format(dtype))
+            result = result.astype(dtype)
+        if mask is not np.ma.nomask:
+            result = np.ma.masked_array(result, mask=mask)
+            inexact &= ~mask
+        return EpochDateTimes(result, unit, epoch), inexact
+
+    def to_datetime64(self, unit=None):
+        """
+        Return the instants as a numpy datetime64 array, for
+        GregorianNoLeapSecond and ISOGregorian calendars.
+
+        Integer offsets in the datetime64 unit, from an epoch a whole
+        number of those units after 1970-01-01, are shifted with a single
+        array addition, or viewed without a copy for a 1970-01-01 epoch.
+        Other offsets are converted through their day ordinals.  As
+        datetime64 has no leap seconds, an instant within a leap second is
+        given as 23:59:59.  Masked offsets are NaT.
+
+        Kwargs:
+
+            * unit - the datetime64 unit code: 'Y', 'M', 'D', 'h', 'm',
+                     's', 'ms' or 'us'.  Defaults to the unit of the
+                     offsets, or the coarsest finer unit in which every
+                     instant is whole, such as for an epoch which is not
+                     a whole number of offset units after 1970-01-01.
+                     'Y' and 'M' require offsets in years or months from
+                     the start of a year or month.
+
+        Raises ValueError for instants which are not a whole number of
+        the given unit, and for instants before year 1, which datetime64
+        numbers differently, as it has a year 0.
+
+        """
+        calendar = self.calendar
+        if calendar is None:
+            calendar = GregorianNoLeapSecond()
+        if not isinstance(calendar, GregorianNoLeapSecond):
+            raise ValueError('Only Gregorian calendars can be converted to '
+                             'datetime64, not {}.'.format(calendar))
+        offsets_unit = self.offsets.unit.unit
+        if unit not in [None, 'ms', 'us'] + list(_datetime64_codes.values()):
+            raise ValueError('Unsupported datetime64 unit {!r}.'.format(unit))
+        offsets = np.ma.getdata(self.offsets.offsets)
+        mask = self.mask
+        shift = None
+        if (np.issubdtype(offsets.dtype, np.integer) and
+                unit in [None, _datetime64_codes[offsets_unit]]):
+            shift = self._unix_shift(calendar)
+        if shift is not None:
+            unit = _datetime64_codes[offsets_unit]
+            values = offsets.astype(np.int64, copy=False)
+            if shift:
+                _check_int64_range(values, 1, shift)
+                values = values + shift
+        elif unit in ['Y', 'M']:
+            raise ValueError('datetime64[{}] requires {} offsets from the '
+                             'start of a {}.'.format(
+                                 unit, _datetime64_units[unit],
+                                 _datetime64_units[unit][:-1]))
+        else:
+            ordinals, ticks = self.ordinals_ticks()
+            ordinals = ordinals - _unix_epoch_ordinal
+            _check_int64_range(ordinals, 86400000000, 86400000000)
+            total = ordinals * 86400000000 + ticks
+            valid = total if mask is np.ma.nomask else total[~mask]
+            if unit is None:
+                # The coarsest unit, no coarser than the offsets, in which
+                # every instant is whole.
+                largest = _datetime64_microseconds.get(
+                    _datetime64_codes[offsets_unit], 86400000000)
+                codes = sorted((code for code, microseconds in
+                                _datetime64_microseconds.items()
+                                if microseconds <= largest),
+                               key=_datetime64_microseconds.get,
+                               reverse=True)
+                unit = next(code for code in codes if not np.any(
+                    valid % _datetime64_microseconds[code]))
+            elif np.any(valid % _datetime64_microseconds[unit]):
+                raise ValueError('The instants are not whole numbers of '
+                                 'datetime64[{}] units.'.format(unit))
+            values = total // _datetime64_microseconds[unit]
+        if mask is not np.ma.nomask:
+            values = np.where(mask, np.iinfo(np.int64).min, values)
+            first = np.ma.masked_array(values, mask=mask).min()
+        else:
+            first = values.min() if values.size else None
+        if (first is not None and first is not np.ma.masked and
+                first < np.datetime64('0001-01-01', unit).astype(np.int64)):
+            raise ValueError('Instants before year 1 cannot be converted '
+                             'to datetime64.')
+        return values.view('datetime64[{}]'.format(unit))
+
+    def _unix_shift(self, calendar):
+        # Return the whole number of offset units from 1970-01-01 to the
+        # epoch, or None if the epoch is not a whole number of units or
+        # leap seconds are counted.
+        unit = self.offsets.unit.unit
+        epoch = self.epoch
+        result = None
+        if unit == 'years':
+            if (epoch.month, epoch.day) == (1, 1) and not any(
+                    _ordinal_ticks(epoch, calendar)[1:]):
+                result = epoch.year - 1970
+        elif unit == 'months':
+            if epoch.day == 1 and not _ordinal_ticks(epoch, calendar)[1]:
+                result = (calendar.month_index(epoch.year, epoch.month) -
+                          calendar.month_index(1970, 1))
+        elif not (unit == 'seconds' and calendar.leapsecond_ordinals):
+            unix_epoch = datetime(1970, 1, 1, calendar=calendar)
+            sample = EpochDateTimes(np.zeros(0, dtype=np.int64), unit,
+                                    unix_epoch)
+            elapsed, per_unit = sample._elapsed_microseconds(epoch)
+            if elapsed % per_unit == 0:
+                result = elapsed // per_unit
+        return result
+
+    @classmethod
+    def from_datetime64(cls, values, calendar=None):
+        """
+        Create an EpochDateTimes from a numpy datetime64 array, with
+        offsets from 1970-01-01 in the array's unit.
+
+        The offsets are an integer view of the values, without a copy,
+        for 'Y', 'M', 'D', 'h', 'm' and 's' units in a
+        GregorianNoLeapSecond calendar.  Weeks are converted to days, and
+        units finer than seconds to float seconds.  For ISOGregorian
+        calendars the leap seconds since 1970 are added to second offsets.
+        NaT values are masked.
+
+        Kwargs:
+
+            * calendar - a GregorianNoLeapSecond or ISOGregorian calendar,
+                         defaults to GregorianNoLeapSecond.
+
+        """
+        if calendar is None:
+            calendar = GregorianNoLeapSecond()
+        if not isinstance(calendar, GregorianNoLeapSecond):
+            raise ValueError('datetime64 values are only Gregorian, not '
+                             '{}.'.format(calendar))
+        values = np.asarray(values)
+        if values.dtype.kind != 'M':
+            raise TypeError('values must be a datetime64 array, not '
+                            '{}.'.format(values.dtype))
+        code, count = np.datetime_data(values.dtype)
+        if code == 'W':
+            code = 'D'
+        if count != 1 or code not in _datetime64_units:
+            if code not in _datetime64_units:
+                code = 'us'
+            values = values.astype('datetime64[{}]'.format(code))
+        offsets = values.view(np.int64)
+        nat = offsets == np.iinfo(np.int64).min
+        if code not in _datetime64_units:
+            offsets = offsets / float(_datetime64_microseconds['s'] //
+                                      _datetime64_microseconds[code])
+            unit = 'seconds'
+        else:
+            unit = _datetime64_units[code]
+        if unit == 'seconds' and calendar.leapsecond_ordinals:
+            # Second offsets count the leap seconds after the epoch.
+            days = np.floor_divide(offsets, 86400).astype(np.int64)
+            leaps = (np.searchsorted(calendar._leapsecond_array,
+                                     days + _unix_epoch_ordinal,
+                                     side='right') -
+                     bisect.bisect_right(calendar.leapsecond_ordinals,
+                                         _unix_epoch_ordinal))
+            offsets = offsets + leaps
+        if nat.any():
+            offsets = np.ma.masked_array(offsets, mask=nat)
+        epoch = datetime(1970, 1, 1, calendar=calendar)
+        return cls(offsets, unit, epoch)
+
+    def components(self):
+        """
+        Return a tuple of integer arrays of the year, month, day, hour,
+        minute, second and microsecond of each offset.
+
+        """
+        return self.datetime_array().components()
+
+    def period_labels(self, period):
+        """
+        Return an int64 array labelling each offset with the 'year',
+        'month', 'season' or 'day' containing it, for use with
+        np.bincount or np.unique.  See :meth:`DatetimeArray.period_labels`.
+
+        """
+        return self.datetime_array().period_labels(period)
+
+    def weekday(self):
+        """
+        Return an int64 array of the weekday of each offset, as an index
+        into the calendar's weekday_names.  See
+        :meth:`DatetimeArray.weekday`.
+
+        """
+        return self.datetime_array().weekday()
+
+    def dayofyear(self):
+        """
+        Return an int64 array of the day of the year of each offset,
+        counting the first day of the year as 1.
+
+        """
+        return self.datetime_array().dayofyear()
+
+    def week_of_year(self):
+        """
+        Return an int64 array of the week of the year of each offset.  See
+        :meth:`DatetimeArray.week_of_year`.
+
+        """
+        return self.datetime_array().week_of_year()
+
+    def period_groups(self, period):
+        """
+        Return the labels of each run of consecutive 1-d offsets in the
+        same 'year', 'month', 'season' or 'day', and the index of the
+        start of each run, for use with np.add.reduceat and similar.
+
+        For sorted offsets each run is a whole period.
+
+        Masked offsets are not part of any period: each run of consecutive
+        masked offsets is a run of its own, with a masked label, so that
+        their values can be dropped from the reduced results.
+
+        """
+        labels = self.period_labels(period)
+        mask = np.ma.getmaskarray(labels)
+        labels = np.ma.getdata(labels)
+        change = np.ones(labels.shape, dtype=bool)
+        change[1:] = (labels[1:] != labels[:-1]) | (mask[1:] != mask[:-1])
+        starts = np.flatnonzero(change)
+        labels = labels[starts]
+        if mask[starts].any():
+            labels = np.ma.masked_array(labels, mask=mask[starts])
+        return labels, starts
+
+    def datetime_array(self):
+        """
+        Return the instants as a :class:`DatetimeArray`, with the shape of
+        the offsets, and the mask of any masked offsets.
+
+        """
+        if self._vectorizable():
+            ordinals, ticks = self.ordinals_ticks()
+            result = DatetimeArray(ordinals, ticks, self.calendar,
+                                   self.epoch.tsep, self.mask)
+        else:
+            offsets = np.asarray(self.offsets.offsets)
+            datetimes = [self.epoch + timedelta(**{self.offsets.unit.unit: v})
+                         for v in offsets.ravel().tolist()]
+            result = DatetimeArray.from_datetimes(datetimes, self.calendar,
+                                                  self.epoch.tsep)
+            result = result.reshape(offsets.shape)
+        return result
+
+    def datetimes(self, workers=None):
+        """
+        Return an array of terra.datetime.datetime objects,
+        or the offsets array if there are problems with deriving
+        datetimes.
+
+        Kwargs:
+
+            * workers - the number of processes to convert chunks of the
+                        offsets in, see :meth:`convert_in_processes`.
+                        Defaults to converting in this process, as do
+                        versions of Python before 3.8.
+
+        """
+        if not self.offsets.offsets.shape:
+            offsets = self.offsets.offsets.reshape((1,))
+        else:
+            offsets = self.offsets.offsets
+        if workers is not None and workers > 1 and self._parallelizable():
+            result = self.convert_in_processes(workers)
+            result = result.reshape(offsets.shape)
+        elif self._vectorizable():
+            result = self.datetime_array().reshape(offsets.shape).strings()
+        elif np.issubdtype(self.offsets.offsets.dtype, np.integer):
+            result = np.array([str(self.epoch +
+                                   timedelta(**{self.offsets.unit.unit: v}))
+                               for v in offsets])
+        else:
+            result = self.offsets.offsets
+        return result
+
+    def __repr__(self):
+        return self.__str__()
+
+
+def _attach(descriptor):
+    # Return an array of shared memory or of a file, from a descriptor of
+    # its source, name, shape and dtype, and the handle to close.
+    source, name, shape, dtype = descriptor
+    if source == 'shared':
+        from multiprocessing import shared_memory
+        handle = shared_memory.SharedMemory(name=name)
+        array = np.ndarray(shape, dtype, buffer=handle.buf)
+    else:
+        array = np.memmap(name, dtype=dtype, mode='r+', shape=shape)
+        handle = array
+    return array, handle
+
+
+def _use_leap_seconds(table):
+    # Use the leap second table of the parent process in a worker of
+    # EpochDateTimes.convert_in_processes, such as one refreshed there.
+    global _leap_seconds
+    if _leap_seconds != table:
+        _leap_seconds = table
+        _calendars.pop(ISOGregorian, None)
+
+
+def _convert_shared(source, mask_source, target, start, stop, unit,
+                    epoch):
+    # Format offsets[start:stop] into target[start:stop], in a worker
+    # process of EpochDateTimes.convert_in_processes.
+    handles = []
+    mask = None
+    offsets, handle = _attach(source)
+    handles.append(handle)
+    chunk = offsets[start:stop]
+    if mask_source is not None:
+        mask, handle = _attach(mask_source)
+        handles.append(handle)
+        chunk = np.ma.masked_array(chunk, mask=mask[start:stop])
+    out, handle = _attach(target)
+    handles.append(handle)
+    sample = EpochDateTimes(chunk, unit, epoch)
+    for _ in sample.iter_chunks(stop - start, out=out[start:stop]):
+        pass
+    if isinstance(out, np.memmap):
+        out.flush()
+    # The arrays must be released before the shared memory is closed.
+    del offsets, mask, chunk, out, sample
+    for handle in handles:
+        if not isinstance(handle, np.ndarray):
+            handle.close()
+
+
+# The temporal units of datetime64 unit codes, and their inverse.
+_datetime64_units = {'Y': 'years', 'M': 'months', 'D': 'days', 'h': 'hours',
+                     'm': 'minutes', 's': 'seconds'}
+_datetime64_codes = dict((unit, code) for code, unit in
+                         _datetime64_units.items())
+
+# The microseconds in each datetime64 unit finer than a month.
+_datetime64_microseconds = {'D': 86400000000, 'h': 3600000000,
+                            'm': 60000000, 's': 1000000, 'ms': 1000, 'us': 1}
+
+# The Gregorian day ordinal of 1970-01-01.
+_unix_epoch_ordinal = 719162
+
+#: The calendar periods instants may be grouped by.
+periods = ('year', 'season', 'month', 'day')
+
+#: The record data type of datetime components written to files.
+component_dtype = np.dtype([(name, '<i4') for name in
+                            ['year', 'month', 'day', 'hour', 'minute',
+                             'second', 'microsecond']])
+
+
+def _check_int64_range(values, scale, shift):
+    # Raise an OverflowError if values * scale + shift may be out of the
+    # range of int64.
+    values = np.asarray(values)
+    if values.size:
+        largest = max(abs(int(values.min())), abs(int(values.max())))
+        if largest * scale + abs(int(shift)) > np.iinfo(np.int64).max:
+            raise OverflowError('The offsets are out of range of int64 '
+                                'microseconds.')
+
+
+# The number of offsets converted at a time when iterating.
+_iteration_block = 4096
+
+
+def _edge_indices(length, edgeitems):
+    # Return the indices of the leading and trailing edge items of an axis.
+    if length > 2 * edgeitems:
+        result = np.r_[0:edgeitems, length - edgeitems:length]
+    else:
+        result = np.arange(length)
+    return result
+
+
+def _summarize(block, shape, edgeitems, indent=1):
+    # Return a NumPy style summary of an array of the given shape from
+    # the block of its edge items.
+    summarized = shape[0] > 2 * edgeitems
+    if block.ndim == 1:
+        items = []
+        for item in block:
+            if item is np.ma.masked:
+                items.append('--')
+            else:
+                items.append("'{}'".format(item))
+        if summarized:
+            items.insert(edgeitems, '...')
+        result = '[{}]'.format(' '.join(items))
+    else:
+        items = [_summarize(row, shape[1:], edgeitems, indent + 1)
+                 for row in block]
+        if summarized:
+            items.insert(edgeitems, '...')
+        separator = '\n' * (block.ndim - 1) + ' ' * indent
+        result = '[{}]'.format(separator.join(items))
+    return result
+
+
+class DatetimeArray(object):
+    """
+    An array of instants within a calendar, stored as columns: an int64
+    array of calendar day ordinals and an int64 array of the microseconds
+    into each day.
+
+    Slicing, masking, comparison, sorting and searching operate on the
+    columns directly, without creating :class:`datetime` instances.
+
+    An optional boolean mask marks missing instants; the components,
+    comparisons and strings of a masked DatetimeArray are masked arrays
+    sharing that mask.
+
+    """
+    def __init__(self, ordinals, ticks=None, calendar=None, tsep='T',
+                 mask=None):
+        """
+        Create a DatetimeArray.
+
+        Args:
+
+            * ordinals - an integer array of day ordinals of the calendar.
+
+        Kwargs:
+
+            * ticks - an integer array of microseconds into each day,
+                      defaults to midnight.
+            * calendar - a :class:`Calendar`, defaults to
+                         :class:`GregorianNoLeapSecond`.
+            * tsep - the separator of the date and time in strings.
+            * mask - a boolean array, True for missing instants.
+
+        """
+        self.ordinals = np.asarray(ordinals, dtype=np.int64)
+        if ticks is None:
+            ticks = np.zeros(self.ordinals.shape, dtype=np.int64)
+        self.ticks = np.asarray(ticks, dtype=np.int64)
+        if self.ordinals.shape != self.ticks.shape:
+            self.ordinals, self.ticks = np.broadcast_arrays(self.ordinals,
+                                                            self.ticks)
+        if calendar is None:
+            calendar = GregorianNoLeapSecond()
+        self.calendar = calendar
+        self.tsep = tsep
+        if mask is None or mask is np.ma.nomask:
+            mask = np.ma.nomask
+        else:
+            mask = np.asarray(mask, dtype=bool)
+            if mask.shape != self.ordinals.shape:
+                mask = np.broadcast_to(mask, self.ordinals.shape).copy()
+        self.mask = mask
+
+    @classmethod
+    def from_components(cls, years, months, days, hours=0, minutes=0,
+                        seconds=0, microseconds=0, calendar=None, tsep='T',
+                        mask=None):
+        """
+        Create a DatetimeArray from integer arrays of the components of
+        each instant.
+
+        """
+        if calendar is None:
+            calendar = GregorianNoLeapSecond()
+        ordinals = calendar.dates_to_ordinals(years, months, days)
+        ticks = ((np.asarray(hours, dtype=np.int64) * 60 + minutes) * 60 +
+                 seconds) * 1000000 + microseconds
+        return cls(ordinals, ticks, calendar, tsep, mask)
+
+    @classmethod
+    def from_datetimes(cls, datetimes, calendar=None, tsep='T'):
+        """Create a DatetimeArray from a sequence of datetimes."""
+        if calendar is None:
+            calendar = GregorianNoLeapSecond()
+        keys = [_ordinal_ticks(adatetime, calendar)
+                for adatetime in datetimes]
+        keys = np.array(keys, dtype=np.int64).reshape((len(keys), 2))
+        return cls(keys[:, 0], keys[:, 1], calendar, tsep)
+
+    @property
+    def shape(self):
+        return self.ordinals.shape
+
+    @property
+    def ndim(self):
+        return self.ordinals.ndim
+
+    @property
+    def size(self):
+        return self.ordinals.size
+
+    def __len__(self):
+        return len(self.ordinals)
+
+    @property
+    def keys(self):
+        """
+        An int64 array ordering the instants: the microseconds from the
+        start of day ordinal 0, ignoring leap seconds.
+
+        """
+        return self.ordinals * 86400000000 + self.ticks
+
+    def _masked(self, array):
+        # Return array as a masked array sharing the mask, if masked.
+        if self.mask is not np.ma.nomask:
+            array = np.ma.masked_array(array, mask=self.mask)
+        return array
+
+    def components(self):
+        """
+        Return a tuple of integer arrays of the year, month, day, hour,
+        minute, second and microsecond of each instant.
+
+        """
+        years, months, days = self.calendar.ordinals_to_dates(self.ordinals)
+        seconds, microseconds = np.divmod(self.ticks, 1000000)
+        minutes, seconds = np.divmod(seconds, 60)
+        hours, minutes = np.divmod(minutes, 60)
+        return tuple(self._masked(component) for component in
+                     (years, months, days, hours, minutes, seconds,
+                      microseconds))
+
+    @property
+    def year(self):
+        return self._masked(self.calendar.ordinals_to_dates(self.ordinals)[0])
+
+    @property
+    def month(self):
+        return self._masked(self.calendar.ordinals_to_dates(self.ordinals)[1])
+
+    @property
+    def day(self):
+        return self._masked(self.calendar.ordinals_to_dates(self.ordinals)[2])
+
+    @property
+    def hour(self):
+        return self._masked(self.ticks // 3600000000)
+
+    @property
+    def minute(self):
+        return self._masked(self.ticks // 60000000 % 60)
+
+    @property
+    def second(self):
+        return self._masked(self.ticks // 1000000 % 60)
+
+    @property
+    def microsecond(self):
+        return self._masked(self.ticks % 1000000)
+
+    def _new(self, ordinals, ticks, mask=None):
+        return DatetimeArray(ordinals, ticks, self.calendar, self.tsep, mask)
+
+    def __getitem__(self, index):
+        if isinstance(index, np.ma.MaskedArray):
+            index = index.filled(False)
+        ordinals = self.ordinals[index]
+        ticks = self.ticks[index]
+        mask = self.mask
+        if mask is not np.ma.nomask:
+            mask = mask[index]
+        if np.ndim(ordinals):
+            result = self._new(ordinals, ticks, mask)
+        elif mask is not np.ma.nomask and mask:
+            result = np.ma.masked
+        else:
+            year, month, day = self.calendar.ordinal_to_date(int(ordinals))
+            second, microsecond = divmod(int(ticks), 1000000)
+            minute, second = divmod(second, 60)
+            hour, minute = divmod(minute, 60)
+            result = datetime(year, month, day, hour, minute, second,
+                              microsecond, calendar=self.calendar,
+                              tsep=self.tsep)
+        return result
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def reshape(self, shape):
+        mask = self.mask
+        if mask is not np.ma.nomask:
+            mask = mask.reshape(shape)
+        return self._new(self.ordinals.reshape(shape),
+                         self.ticks.reshape(shape), mask)
+
+    def filled_keys(self):
+        """
+        Return the ordering keys with masked instants given the largest
+        int64 value, so that they sort after every instant.
+
+        """
+        keys = self.keys
+        if self.mask is not np.ma.nomask:
+            keys = np.where(self.mask, np.iinfo(np.int64).max, keys)
+        return keys
+
+    def _other_keys(self, other):
+        # Return the ordering keys of a DatetimeArray or datetime, in
+        # the calendar of this array.
+        if isinstance(other, DatetimeArray):
+            calendar = other.calendar
+            result = other.keys
+            if other.mask is not np.ma.nomask:
+                result = np.ma.masked_array(result, mask=other.mask)
+        elif isinstance(other, (datetime, frozendatetime)):
+            calendar = other.calendar
+            if calendar is None:
+                calendar = GregorianNoLeapSecond()
+            ordinal, ticks = _ordinal_ticks(other, calendar)
+            result = ordinal * 86400000000 + ticks
+        else:
+            msg = "unsupported operand type(s): '{}' and '{}'"
+            msg = msg.format(type(self), type(other))
+            raise TypeError(msg)
+        if not self.calendar == calendar:
+            raise NotImplementedError('{} != {}'.format(self.calendar,
+                                                        calendar))
+        return result
+
+    def __eq__(self, other):
+        return self._masked(self.keys) == self._other_keys(other)
+
+    def __ne__(self, other):
+        return self._masked(self.keys) != self._other_keys(other)
+
+    def __lt__(self, other):
+        return self._masked(self.keys) < self._other_keys(other)
+
+    def __le__(self, other):
+        return self._masked(self.keys) <= self._other_keys(other)
+
+    def __gt__(self, other):
+        return self._masked(self.keys) > self._other_keys(other)
+
+    def __ge__(self, other):
+        return self._masked(self.keys) >= self._other_keys(other)
+
+    __hash__ = None
+
+    def __add__(self, other):
+        """
+        Add a :class:`TimedeltaArray`, or a scalar integer
+        :class:`timedelta`, to each instant, broadcasting the two.
+
+        """
+        if isinstance(other, timedelta):
+            other = TimedeltaArray.from_timedelta(other)
+        if not isinstance(other, TimedeltaArray):
+            return NotImplemented
+        calendar = self.calendar
+        ordinals = self.ordinals
+        if other.years.any():
+            ordinals = _shift_months(calendar, ordinals,
+                                     other.years * calendar.months_in_year)
+        if other.months.any():
+            ordinals = _shift_months(calendar, ordinals, other.months)
+        ordinals = ordinals + other.days
+        seconds = other.seconds
+        if calendar.leapsecond_datetimes and seconds.any():
+            seconds = seconds - calendar.leapseconds_elapsed(
+                ordinals, self.ticks // 1000000, seconds)
+        days, ticks = np.divmod(self.ticks + other.microseconds +
+                                seconds * 1000000, 86400000000)
+        return self._new(ordinals + days, ticks,
+                         np.ma.mask_or(self.mask, other.mask))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, timedelta):
+            other = TimedeltaArray.from_timedelta(other)
+        if not isinstance(other, TimedeltaArray):
+            return NotImplemented
+        return self + -other
+
+    def period_labels(self, period):
+        """
+        Return an int64 array labelling each instant with the calendar
+        period containing it, from the calendar's month tables.
+
+        Labels increase with time and are:
+
+            * 'year' - the year.
+            * 'month' - year * months_in_year + month - 1.
+            * 'season' - year * 4 + season, for the seasons 0 (December to
+                         February, labelled with the year of January), 1
+                         (March to May), 2 (June to August) and 3
+                         (September to November) of 12 month calendars.
+            * 'day' - the calendar day ordinal.
+
+        """
+        if period == 'day':
+            result = self.ordinals
+        elif period in ['year', 'month', 'season']:
+            years, months, _ = self.calendar.ordinals_to_dates(self.ordinals)
+            months_in_year = self.calendar.months_in_year
+            if period == 'year':
+                result = years
+            elif period == 'month':
+                result = years * months_in_year + months - 1
+            elif months_in_year != 12:
+                raise ValueError('Seasons are only defined for calendars '
+                                 'of 12 months.')
+            else:
+                result = (years * 12 + months) // 3
+        else:
+            raise ValueError('period must be one of {}, not '
+                             '{!r}.'.format(', '.join(periods), period))
+        return self._masked(result)
+
+    def weekday(self):
+        """
+        Return an int64 array of the weekday of each instant, as an index
+        into the calendar's weekday_names; 0 is Sunday for the Gregorian
+        calendars.
+
+        Raises ValueError for calendars which define no weeks.
+
+        """
+        return self._masked(self.calendar.ordinals_to_weekdays(self.ordinals))
+
+    def _day_of_year(self):
+        # Return the days since the start of the year of each instant.
+        years = self.calendar.ordinals_to_dates(self.ordinals)[0]
+        return self.ordinals - self.calendar.days_before_year(years)
+
+    def dayofyear(self):
+        """
+        Return an int64 array of the day of the year of each instant,
+        counting the first day of the year as 1.
+
+        """
+        return self._masked(self._day_of_year() + 1)
+
+    def week_of_year(self):
+        """
+        Return an int64 array of the week of the year of each instant.
+
+        Weeks start on the first of the calendar's weekday_names.  Week 1
+        starts on the first such day of the year, and any days of the year
+        before it are in week 0, as for strftime's %U.
+
+        """
+        days_in_week = self.calendar.days_in_week
+        weekdays = self.calendar.ordinals_to_weekdays(self.ordinals)
+        return self._masked((self._day_of_year() + days_in_week - weekdays) //
+                            days_in_week)
+
+    def argsort(self, kind='stable'):
+        """
+        Return the indices which sort the instants, with any masked
+        instants last.
+
+        """
+        return np.argsort(self.filled_keys(), kind=kind)
+
+    def sort(self):
+        """Return a sorted copy of this DatetimeArray."""
+        return self[self.argsort()]
+
+    def searchsorted(self, value, side='left'):
+        """
+        Return the indices at which a datetime, or the instants of a
+        DatetimeArray, would be inserted to keep this sorted
+        DatetimeArray in order.  Masked instants are taken to sort last.
+
+        """
+        return np.searchsorted(self.filled_keys(), self._other_keys(value),
+                               side=side)
+
+    def unique(self, return_index=False, return_inverse=False):
+        """
+        Return the sorted unique instants as a DatetimeArray, and
+        optionally the indices of their first occurrences and the
+        indices which reconstruct this DatetimeArray from them.
+
+        Masked instants are excluded, and masked in the inverse indices.
+
+        """
+        keys, index, inverse = np.unique(self.filled_keys().ravel(),
+                                         return_index=True,
+                                         return_inverse=True)
+        inverse = self._masked(inverse.reshape(self.shape))
+        if self.mask is not np.ma.nomask and self.mask.any():
+            keys = keys[:-1]
+            index = index[:-1]
+        ordinals, ticks = np.divmod(keys, 86400000000)
+        result = [self._new(ordinals, ticks)]
+        if return_index:
+            result.append(index)
+        if return_inverse:
+            result.append(inverse)
+        if len(result) == 1:
+            result = result[0]
+        else:
+            result = tuple(result)
+        return result
+
+    def strings(self, kind='U', out=None):
+        """
+        Return a fixed width NumPy string array of ISO datetimes.
+
+        Kwargs:
+
+            * kind - 'U' for a unicode result or 'S' for a bytes result.
+            * out - a C contiguous S or U array of the shape of this
+                    DatetimeArray to write the result into; masked
+                    elements are written as empty strings.
+
+        See :func:`format_components`.
+
+        """
+        components = [np.ma.getdata(component)
+                      for component in self.components()]
+        if out is not None and out.shape != self.shape:
+            raise ValueError('out has shape {}, not {}.'.format(out.shape,
+                                                               self.shape))
+        result = format_components(components, self.tsep, kind=kind, out=out)
+        result = result.reshape(self.shape)
+        if out is not None and self.mask is not np.ma.nomask:
+            result[self.mask] = ''
+        return self._masked(result)
+
+    def __str__(self):
+        return str(self.strings())
+
+    def __repr__(self):
+        return 'terra.datetime.DatetimeArray({}, calendar={})'.format(
+            self.strings(), type(self.calendar).__name__)
+
+
+def _shift_months(calendar, ordinals, shift):
+    # Return the day ordinals moved by whole calendar months, skipping
+    # null years, with days beyond the end of the new month clamped to it.
+    years, months, days = calendar.ordinals_to_dates(ordinals)
+    indices = calendar.month_index(years, months) + shift
+    year_indices, months = np.divmod(indices, calendar.months_in_year)
+    months += 1
+    years = calendar.index_years(year_indices)
+    days = np.minimum(days, calendar.month_lengths(years, months))
+    return calendar.dates_to_ordinals(years, months, days)
+
+
+def _ordinal_ticks(adatetime, calendar):
+    # Return the day ordinal within calendar and the microseconds into
+    # the day of a datetime.
+    ordinal = calendar.date_to_ordinal(adatetime.year, adatetime.month,
+                                       adatetime.day)
+    second = adatetime.second
+    microsecond = adatetime.microsecond
+    if microsecond is None:
+        microsecond = int(round((second % 1) * 1e6))
+        second = int(second)
+    ticks = ((adatetime.hour * 60 + adatetime.minute) * 60 +
+             second) * 1000000 + microsecond
+    return ordinal, ticks
+
+
+def format_components(components, tsep='T', kind='U', out=None):
+    """
+    Return a fixed width NumPy string array of ISO formatted datetimes
+    from a sequence of year, month, day, hour, minute, second and
+    microsecond integer arrays.
+
+    The characters are written directly into a preallocated buffer, of
+    width 19, or 26 if any microseconds are non-zero; elements with no
+    microseconds are null padded, so each element matches the string of
+    the equivalent :class:`datetime`.
+
+    Kwargs:
+
+        * tsep - the single character separating the date and the time.
+        * kind - 'U' for a unicode result or 'S' for a bytes result.
+        * out - a C contiguous S or U array, such as a :class:`np.memmap`,
+                with an element for each datetime, to write the result
+                into and return.  The kind is taken from out.
+
+    """
+    components = [np.asarray(column).ravel() for column in components]
+    years = components[0]
+    if out is not None:
+        kind = out.dtype.kind
+        if not out.flags.c_contiguous or out.size != years.size:
+            raise ValueError('out must be a C contiguous array of {} '
+                             'elements.'.format(years.size))
+    if kind not in ['U', 'S']:
+        raise ValueError("kind must be one of 'U' or 'S', "
+                         "not {!r}.".format(kind))
+    char_dtype = np.uint32 if kind == 'U' else np.uint8
+    if (len(tsep) != 1 or years.size and
+            (years.min() < 0 or years.max() > 9999)):
+        # Fall back to formatting each element.
+        result = np.array([str(date(*ymd)) + tsep + str(time(*hmsu))
+                           for ymd, hmsu in _zip_components(components)],
+                          dtype=kind)
+        if out is not None:
+            if result.dtype.itemsize > out.dtype.itemsize:
+                raise ValueError('out is too narrow for {} '
+                                 'strings.'.format(result.dtype))
+            out.reshape(-1)[:] = result
+            result = out
+    else:
+        microseconds = components[6]
+        has_fraction = microseconds.any()
+        width = 26 if has_fraction else 19
+        if out is None:
+            result = np.empty(years.shape, dtype='{}{}'.format(kind, width))
+        elif out.dtype.itemsize // np.dtype(char_dtype).itemsize < width:
+            raise ValueError('out is too narrow for {} character '
+                             'strings.'.format(width))
+        else:
+            result = out
+        columns = result.dtype.itemsize // np.dtype(char_dtype).itemsize
+        chars = result.view(char_dtype).reshape(years.shape + (columns,))
+        chars[:, width:] = 0
+        _write_digits(chars[:, :width], components, tsep)
+        if has_fraction:
+            chars[microseconds == 0, 19:] = 0
+    return result
+
+
+# The two ASCII digit characters of each number from 0 to 99.
+_digit_pairs = np.array([[ord(c) for c in '{:02}'.format(i)]
+                         for i in range(100)], dtype=np.uint8)
+
+# Lazily built lookup tables of the characters of every four digit year
+# and of every 'HH:MM:SS' time of day.
+_year_chars = None
+_time_of_day_chars = None
+
+
+def _write_pairs(chars, values, column, ndigits):
+    # Write the zero padded decimal digits of values, two at a time,
+    # into the columns of a 2D character code array from column onwards.
+    for pair in range(ndigits // 2):
+        values, remainder = np.divmod(values, 100)
+        stop = column + ndigits - 2 * pair
+        chars[:, stop - 2:stop] = _digit_pairs[remainder]
+
+
+def _lookup_tables():
+    global _year_chars, _time_of_day_chars
+    if _year_chars is None:
+        _year_chars = np.empty((10000, 4), dtype=np.uint8)
+        _write_pairs(_year_chars, np.arange(10000), 0, 4)
+        seconds = np.arange(86400)
+        _time_of_day_chars = np.empty((86400, 8), dtype=np.uint8)
+        _write_pairs(_time_of_day_chars, seconds // 3600, 0, 2)
+        _write_pairs(_time_of_day_chars, seconds // 60 % 60, 3, 2)
+        _write_pairs(_time_of_day_chars, seconds % 60, 6, 2)
+        _time_of_day_chars[:, [2, 5]] = ord(':')
+    return _year_chars, _time_of_day_chars
+
+
+def _write_digits(chars, components, tsep):
+    # Write the ISO formatted character codes of each datetime into the
+    # rows of a 2D unsigned integer array, 19 or 26 columns wide.
+    years, months, days, hours, minutes, seconds, microseconds = components
+    year_chars, time_of_day_chars = _lookup_tables()
+    chars[:, 0:4] = year_chars[years]
+    _write_pairs(chars, months, 5, 2)
+    _write_pairs(chars, days, 8, 2)
+    chars[:, 11:19] = time_of_day_chars[(hours * 60 + minutes) * 60 +
+                                        seconds]
+    chars[:, 4] = ord('-')
+    chars[:, 7] = ord('-')
+    chars[:, 10] = ord(tsep)
+    if chars.shape[-1] > 19:
+        chars[:, 19] = ord('.')
+        _write_pairs(chars, microseconds, 20, 6)
+
+
+def _readonly(array):
+    array.flags.writeable = False
+    return array
+
+
+def _zip_components(components):
+    # Yield ((year, month, day), (hour, minute, second, microsecond))
+    # tuples of Python integers from component arrays.
+    columns = [column.ravel().tolist() for column in components]
+    for row in zip(*columns):
+        yield row[:3], row[3:]
+
+
+# The shared instance of each Calendar class, created on first use.
+_calendars = {}
+
+
+# The first and last years of the leap year tables of calendars with no
+# closed form leap year count.
+_leap_table_years = (-9999, 10000)
+
+
+class _CalendarType(type):
+    """
+    The type of terra Calendars, which interns the instances of Calendar
+    classes created without arguments and makes every Calendar immutable
+    once constructed.
+
+    """
+    def __call__(cls, *args, **kwargs):
+        if args or kwargs:
+            result = super(_CalendarType, cls).__call__(*args, **kwargs)
+        else:
+            result = _calendars.get(cls)
+            if result is None:
+                result = super(_CalendarType, cls).__call__()
+                object.__setattr__(result, '_interned', True)
+                _calendars[cls] = result
+        object.__setattr__(result, '_frozen', True)
+        return result
+
+
+def get_calendar(calendar):
+    """
+    Return the shared instance of a terra Calendar class, given the class
+    or its name, such as 'ISOGregorian'.
+
+    """
+    if isinstance(calendar, six.string_types):
+        classes = [Calendar]
+        for cls in classes:
+            classes.extend(cls.__subclasses__())
+        named = [cls for cls in classes if cls.__name__ == calendar]
+        if not named:
+            raise ValueError('{} is not a terra Calendar.'.format(calendar))
+        calendar = named[0]
+    return calendar()
+
+
+class Calendar(six.with_metaclass(_CalendarType, object)):
+    """
+    A representation of the relationship between the different elements
+    of a potential datetime instance.
+
+    This includes the definition of periodic and nested
+    unit like quantities.
+
+    Calendars are immutable.  Calendar classes created without arguments,
+    such as ISOGregorian(), return one shared instance, which carries
+    lookup tables precomputed for date arithmetic.
+
+    """
+    _interned = False
+    _frozen = False
+
+    def __init__(self, url=None,
+                 leap_year_date=None,
+                 month_names=None,
+                 month_day_map=None, leapsecond_datetimes=None,
+                 weekday_names=None,
+                 weekday_start_date=None, null_years=None):
+        self.url = url
+        self.leap_year_date = leap_year_date
+        if month_names is None:
+            month_names = []
+        self.month_names = tuple(month_names)
+        if len(month_names) != len(month_day_map):
+            raise ValueError('month names:\n{}\nis not the same length as '
+                             'month_day_map:\n'
+                             '{}\n'.format(month_names, month_day_map))
+        self.month_day_map = tuple(month_day_map)
+        if leapsecond_datetimes is None:
+            leapsecond_datetimes = []
+        self.leapsecond_datetimes = tuple(leapsecond_datetimes)
+        if weekday_names is None:
+            weekday_names = []
+        self.weekday_names = tuple(weekday_names)
+        self.weekday_start_date = weekday_start_date
+        if null_years is None:
+            null_years = []
+        self.null_years = tuple(sorted(null_years))
+        self._precompute()
+
+    def _precompute(self):
+        # Build the lookup tables used by date arithmetic.
+        self._leap_years_table = None
+        if (type(self).is_leap_year is not Calendar.is_leap_year and
+                type(self).leap_years_before is Calendar.leap_years_before):
+            # The leap years before each year of the table, relative to
+            # year 1, for calendars with no closed form count.
+            first, stop = _leap_table_years
+            counts = np.cumsum([0] + [bool(self.is_leap_year(year))
+                                      for year in range(first, stop)])
+            self._leap_years_table = _readonly(
+                (counts - counts[1 - first]).astype(np.int64))
+        self._month_numbers = {}
+        for i, name in enumerate(self.month_names):
+            self._month_numbers[name] = i + 1
+            self._month_numbers[name[0:3]] = i + 1
+        self._days_in_year = sum(self.month_day_map)
+        self._null_year_set = frozenset(self.null_years)
+        self._null_year_days = tuple((year, self._days_in_year +
+                                      bool(self.is_leap_year(year)))
+                                     for year in self.null_years)
+        # The year index of each null year, which is shared with the
+        # following year; see index_years.
+        self._null_year_indices = _readonly(np.array(
+            [self.year_index(year) for year in self.null_years],
+            dtype=np.int64))
+        common = [0]
+        for days in self.month_day_map:
+            common.append(common[-1] + days)
+        leap = list(common)
+        if self.leap_year_date is not None:
+            for i in range(self.leap_year_date.month, len(leap)):
+                leap[i] += 1
+        self._cumulative_days = (tuple(common), tuple(leap))
+        self._cumulative_days_array = _readonly(
+            np.array(self._cumulative_days, dtype=np.int64))
+        ndays = max(common[-1], leap[-1])
+        self._month_of_day = _readonly(
+            np.array([np.searchsorted(table, np.arange(ndays), side='right')
+                      for table in self._cumulative_days], dtype=np.int64))
+        ordinals = []
+        for day, month, year in self.leapsecond_datetimes:
+            adate = date(year, month, day, calendar=self)
+            ordinals.append(self.date_to_ordinal(adate.year, adate.month,
+                                                 adate.day))
+        self.leapsecond_ordinals = tuple(sorted(ordinals))
+        self._leapsecond_array = _readonly(
+            np.array(self.leapsecond_ordinals, dtype=np.int64))
+        self._leapsecond_instants = _readonly(self._leapsecond_array * 86400)
+
+    def __setattr__(self, name, value):
+        if self._frozen:
+            raise AttributeError('terra Calendars are immutable.')
+        super(Calendar, self).__setattr__(name, value)
+
+    def __reduce_ex__(self, protocol):
+        # Only the current shared instance is rebuilt from its class; an
+        # ISOGregorian replaced by refresh_leap_seconds keeps its table.
+        if self._interned and _calendars.get(type(self)) is self:
+            result = (type(self), ())
+        else:
+            result = super(Calendar, self).__reduce_ex__(protocol)
+        return result
+
+    def is_leap_year(self, year):
+        """Return True for leap years, False for non-leap years."""
+        return False
+
+    @property
+    def days_in_week(self):
+        return len(self.weekday_names)
+
+    @property
+    def months_in_year(self):
+        return len(self.month_names)
+
+    @property
+    def days_in_year(self):
+        return self._days_in_year
+
+    @property
+    def days_in_leap_year(self):
+        return None
+
+    @property
+    def mean_year_length(self):
+        """The average number of days in a year, used to estimate years."""
+        return self.days_in_year
+
+    def is_valid_year(self, year):
+        return year not in self._null_year_set
+
+    def cumulative_month_days(self, year):
+        """
+        Return the number of days before the start of each month of the
+        given year, with a final entry holding the length of the year.
+
+        """
+        return self._cumulative_days[bool(self.is_leap_year(year))]
+
+    def leap_years_before(self, year):
+        """
+        Return a count of the leap years before the given year.
+
+        Only differences between counts are meaningful: the count is taken
+        relative to year 1, so it is negative for years before year 1.
+        Calendars with a leap year rule may override this with a closed
+        form.  The default looks the count up in a table of the years
+        -9999 to 10000, precomputed from is_leap_year, and counts any years
+        beyond the table one at a time.
+
+        """
+        table = self._leap_years_table
+        if table is None:
+            result = year * 0
+        elif isinstance(year, np.ndarray):
+            index = year - _leap_table_years[0]
+            result = table.take(index, mode='clip')
+            outside = np.flatnonzero((index < 0) | (index >= table.size))
+            for i in outside:
+                result.flat[i] = self._count_leap_years(int(year.flat[i]))
+        elif 0 <= year - _leap_table_years[0] < table.size:
+            result = int(table[year - _leap_table_years[0]])
+        else:
+            result = self._count_leap_years(year)
+        return result
+
+    def _count_leap_years(self, year):
+        # Count the leap years before a year beyond the leap year table,
+        # from the nearest end of the table.
+        first, stop = _leap_table_years
+        table = self._leap_years_table
+        if year > stop:
+            result = int(table[-1]) + sum(1 for y in range(stop, year)
+                                          if self.is_leap_year(y))
+        else:
+            result = int(table[0]) - sum(1 for y in range(year, first)
+                                         if self.is_leap_year(y))
+        return result
+
+    def leap_year_mask(self, years):
+        """Return a boolean array, True for the leap years in years."""
+        years = np.asarray(years)
+        if type(self).is_leap_year is Calendar.is_leap_year:
+            result = np.zeros(years.shape, dtype=bool)
+        elif self._leap_years_table is not None:
+            result = (self.leap_years_before(years + 1) -
+                      self.leap_years_before(years)).astype(bool)
+        else:
+            result = np.vectorize(self.is_leap_year, otypes=[bool])(years)
+        return result
+
+    def _null_years_before(self, year):
+        # Count null years before year, relative to year 1.
+        result = 0
+        for y in self.null_years:
+            result = result + (year > y) * 1 - (y < 1)
+        return result
+
+    def _null_days_before(self, year):
+        # Count days in null years before year, relative to year 1.
+        result = 0
+        for y, ylen in self._null_year_days:
+            result = result + ylen * ((year > y) * 1 - (y < 1))
+        return result
+
+    def days_before_year(self, year):
+        """
+        Return the number of days from the first day of year 1 to the
+        first day of the given year.
+
+        """
+        return ((year - 1) * self.days_in_year + self.leap_years_before(year) -
+                self._null_days_before(year))
+
+    def date_to_ordinal(self, year, month, day):
+        """
+        Return the day ordinal of a date within this calendar, counting
+        the first day of year 1 as day 0.
+
+        """
+        return (self.days_before_year(year) +
+                self.cumulative_month_days(year)[month - 1] + day - 1)
+
+    def ordinal_to_date(self, ordinal):
+        """
+        Return the (year, month, day) of a day ordinal within this calendar.
+
+        """
+        year = int(ordinal // self.mean_year_length) + 1
+        while self.days_before_year(year) > ordinal:
+            year -= 1
+        while self.days_before_year(year + 1) <= ordinal:
+            year += 1
+        dayofyear = ordinal - self.days_before_year(year)
+        cumulative = self.cumulative_month_days(year)
+        month = bisect.bisect_right(cumulative, dayofyear)
+        day = dayofyear - cumulative[month - 1] + 1
+        return year, month, day
+
+    def count_leapseconds(self, start, end):
+        """
+        Return the number of leap seconds after the start of the day
+        ordinal start, up to and including the start of the day ordinal end.
+
+        The result is negative if end is before start.
+
+        """
+        ordinals = self.leapsecond_ordinals
+        return (bisect.bisect_right(ordinals, end) -
+                bisect.bisect_right(ordinals, start))
+
+    def dates_to_ordinals(self, years, months, days):
+        """
+        Return an array of day ordinals from arrays of years, months and days.
+
+        """
+        years = np.asarray(years, dtype=np.int64)
+        leap = self.leap_year_mask(years).astype(np.intp)
+        cumulative = self._cumulative_days_array[leap, np.asarray(months) - 1]
+        return self.days_before_year(years) + cumulative + days - 1
+
+    def ordinals_to_weekdays(self, ordinals):
+        """
+        Return an array of the weekday of each day ordinal, as an index
+        into weekday_names, counting from the weekday_start_date.
+
+        """
+        start = self.weekday_start_date
+        if not self.weekday_names or start is None:
+            raise ValueError('{} does not define weekdays.'.format(
+                type(self).__name__))
+        first = self.date_to_ordinal(start.year, start.month, start.day)
+        ordinals = np.asarray(ordinals, dtype=np.int64)
+        return (ordinals - first) % self.days_in_week
+
+    def ordinals_to_dates(self, ordinals):
+        """
+        Return arrays of the years, months and days of an array of
+        day ordinals.
+
+        """
+        ordinals = np.asarray(ordinals, dtype=np.int64)
+        shape = ordinals.shape
+        # 1-d, as arithmetic on 0-d arrays gives scalars, which the
+        # corrections below cannot update in place.
+        ordinals = ordinals.ravel()
+        years = (ordinals // self.mean_year_length).astype(np.int64) + 1
+        start = self.days_before_year(years)
+        end = self.days_before_year(years + 1)
+        # Correct the estimated years, which are rarely wrong.
+        wrong = np.flatnonzero((start > ordinals) | (end <= ordinals))
+        while wrong.size:
+            step = ((end.flat[wrong] <= ordinals.flat[wrong]).astype(np.int64) -
+                    (start.flat[wrong] > ordinals.flat[wrong]))
+            years.flat[wrong] += step
+            start.flat[wrong] = self.days_before_year(years.flat[wrong])
+            end.flat[wrong] = self.days_before_year(years.flat[wrong] + 1)
+            wrong = wrong[(start.flat[wrong] > ordinals.flat[wrong]) |
+                          (end.flat[wrong] <= ordinals.flat[wrong])]
+        dayofyear = ordinals - start
+        leap = (end - start > self.days_in_year).astype(np.intp)
+        months = self._month_of_day[leap, dayofyear]
+        days = dayofyear - self._cumulative_days_array[leap, months - 1] + 1
+        return years.reshape(shape), months.reshape(shape), days.reshape(shape)
+
+    def leapseconds_elapsed(self, ordinal, second, elapsed):
+        """
+        Return the number of leap seconds passed over by moving elapsed
+        (SI) seconds from the instant `second` seconds into the day
+        ordinal.  Elapsed may be an integer array.
+
+        The count is negative for negative elapsed values.  An instant
+        within a leap second is reported as 23:59:59 of the preceding day.
+
+        Each count is two binary searches of the sorted leap second
+        instants, so is O(log n) in the number of leap seconds.
+
+        """
+        instants = self._leapsecond_instants
+        instant = ordinal * 86400 + second
+        naive = instant + np.asarray(elapsed)
+        if not instants.size:
+            return naive * 0
+        start = np.searchsorted(instants, instant, side='right')
+        end = np.searchsorted(instants, naive, side='right')
+        # The leap seconds between the instant and the naive result;
+        # because leap seconds are days apart, the farthest of these is
+        # the only one which may be passed over by removing the others.
+        count = end - start
+        farthest = instants.take(np.where(count > 0, end - 1, end),
+                                 mode='clip')
+        result = count - ((count > 0) & (farthest > naive - count + 1))
+        result = result + ((count < 0) & (farthest <= naive - count))
+        return result
+
+    def year_index(self, year):
+        """
+        Return the number of valid years from year 1 to the given year.
+
+        """
+        return year - 1 - self._null_years_before(year)
+
+    def index_year(self, index):
+        """Return the year for a year index, the inverse of year_index."""
+        year = index + 1
+        while self.year_index(year) < index:
+            year += 1
+        while self.year_index(year) > index:
+            year -= 1
+        if not self.is_valid_year(year):
+            if not self.is_valid_year(year + 1):
+                msg = ('There are two adjacent skip years in this '
+                       'calendar period: {}, {}.')
+                msg = msg.format(year, year + 1)
+                raise ValueError(msg)
+            year += 1
+        return year
+
+    def index_years(self, indices):
+        """
+        Return an array of the years of an array of year indices, the
+        vectorized inverse of year_index.
+
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        skipped = np.searchsorted(self._null_year_indices, indices,
+                                  side='right')
+        before_year_1 = sum(1 for year in self.null_years if year < 1)
+        return indices + 1 + skipped - before_year_1
+
+    def month_lengths(self, years, months):
+        """Return an array of the number of days in each month of a year."""
+        leap = self.leap_year_mask(years).astype(np.intp)
+        months = np.asarray(months)
+        return (self._cumulative_days_array[leap, months] -
+                self._cumulative_days_array[leap, months - 1])
+
+    def month_index(self, year, month):
+        """
+        Return the number of whole months from the start of year 1 to the
+        start of the given month.
+
+        """
+        return self.year_index(year) * self.months_in_year + month - 1
+
+    def index_month(self, index):
+        """
+        Return the (year, month) for a month index, the inverse of
+        month_index.
+
+        """
+        yindex, month = divmod(index, self.months_in_year)
+        return self.index_year(yindex), month + 1
+
+    @property
+    def _definition(self):
+        leap_year_date = None
+        if self.leap_year_date is not None:
+            leap_year_date = (self.leap_year_date.month,
+                              self.leap_year_date.day)
+        weekday_start_date = None
+        if self.weekday_start_date is not None:
+            weekday_start_date = (self.weekday_start_date.year,
+                                  self.weekday_start_date.month,
+                                  self.weekday_start_date.day)
+        return (self.month_names, self.month_day_map, leap_year_date,
+                self.null_years, self.weekday_names, weekday_start_date,
+                self.leapsecond_ordinals)
+
+    def __eq__(self, other):
+        return self is other or (type(self) is type(other) and
+                                 self._definition == other._definition)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash((type(self), self._definition))
+
+
+class G360Day(Calendar):
+    def __init__(self):
+        url = None
+        month_names = ['January', 'February', 'March', 'April', 'May', 'June',
+                       'July', 'August', 'September', 'October', 'November',
+                       'December']
+        month_day_map = [30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30]
+
+        # leapsecond_datetimes = None
+        # weekday_names = None
+        # weekday_start_date = None
+        # null_years = None
+        super(G360Day, self).__init__(url, month_names=month_names,
+                                      month_day_map=month_day_map)
+
+
+class G365Day(Calendar):
+    def __init__(self):
+        url = None
+        month_names = ['January', 'February', 'March', 'April', 'May', 'June',
+                       'July', 'August', 'September', 'October', 'November',
+                       'December']
         
         month_day_map = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
         # leapsecond_datetimes = None
@@ -1021,6 +3341,28 @@ class GregorianNoLeapSecond(Calendar):
         """Return True for leap years, False for non-leap years."""
         return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
 
+    def leap_years_before(self, year):
+        """
+        Return a count of the leap years before the given year, relative
+        to year 1.
+
+        """
+        year = year - 1
+        return year // 4 - year // 100 + year // 400
+
+    # The leap years of each year of the 400 year Gregorian cycle.
+    _leap_cycle = np.array([year % 4 == 0 and
+                            (year % 100 != 0 or year % 400 == 0)
+                            for year in range(400)])
+
+    def leap_year_mask(self, years):
+        """Return a boolean array, True for the leap years in years."""
+        return self._leap_cycle[np.asarray(years) % 400]
+
+    @property
+    def mean_year_length(self):
+        return 365.2425
+
     @property
     def days_in_leap_year(self):
         return self.days_in_year + 1
@@ -1028,51 +3370,146 @@ class GregorianNoLeapSecond(Calendar):
 
 class ISOGregorian(GregorianNoLeapSecond):
     def __init__(self):
-        super(ISOGregorian, self).__init__()
-        self.leapsecond_datetimes = self.get_ietf_leap_seconds()
+        # The Gregorian definition, with the leap seconds of this process.
+        gregorian = GregorianNoLeapSecond()
+        Calendar.__init__(self, gregorian.url, gregorian.leap_year_date,
+                          gregorian.month_names, gregorian.month_day_map,
+                          leap_seconds(), gregorian.weekday_names,
+                          gregorian.weekday_start_date, gregorian.null_years)
 
     def get_ietf_leap_seconds(self):
-        ietf_uri = 'https://www.ietf.org/timezones/data/leap-seconds.list'
-        static = ('2272060800	10	# 1 Jan 1972\n'
-                  '2287785600	11	# 1 Jul 1972\n'
-                  '2303683200	12	# 1 Jan 1973\n'
-                  '2335219200	13	# 1 Jan 1974\n'
-                  '2366755200	14	# 1 Jan 1975\n'
-                  '2398291200	15	# 1 Jan 1976\n'
-                  '2429913600	16	# 1 Jan 1977\n'
-                  '2461449600	17	# 1 Jan 1978\n'
-                  '2492985600	18	# 1 Jan 1979\n'
-                  '2524521600	19	# 1 Jan 1980\n'
-                  '2571782400	20	# 1 Jul 1981\n'
-                  '2603318400	21	# 1 Jul 1982\n'
-                  '2634854400	22	# 1 Jul 1983\n'
-                  '2698012800	23	# 1 Jul 1985\n'
-                  '2776982400	24	# 1 Jan 1988\n'
-                  '2840140800	25	# 1 Jan 1990\n'
-                  '2871676800	26	# 1 Jan 1991\n'
-                  '2918937600	27	# 1 Jul 1992\n'
-                  '2950473600	28	# 1 Jul 1993\n'
-                  '2982009600	29	# 1 Jul 1994\n'
-                  '3029443200	30	# 1 Jan 1996\n'
-                  '3076704000	31	# 1 Jul 1997\n'
-                  '3124137600	32	# 1 Jan 1999\n'
-                  '3345062400	33	# 1 Jan 2006\n'
-                  '3439756800	34	# 1 Jan 2009\n'
-                  '3550089600	35	# 1 Jul 2012\n'
-                  '3644697600	36	# 1 Jul 2015\n'
-                  '3692217600	37	# 1 Jan 2017\n')
-        try:
-            res = requests.get(ietf_uri)
-            if res.status_code != 200:
-                instr = static
-            instr = res.text.split('\n')
-        # requests.packages.urllib3.exceptions.MaxRetryError:
-        except Exception:
-            instr = static.split('\n')
-
-        leap_years = []
-        for line in instr:
-            if line and not line.startswith('#'):
-                day, month, year = line.split('#')[1].split(' ')[1:4]
-                leap_years.append((int(day), month, int(year)))
-        return leap_years
+        """
+        Return the IETF leap second table as (day, month, year) tuples.
+
+        No network access is made, see :func:`leap_seconds`.
+
+        """
+        return leap_seconds()
+
+
+#: The location of the IETF list of leap seconds.
+IETF_LEAP_SECONDS_URL = 'https://www.ietf.org/timezones/data/leap-seconds.list'
+
+#: The path of an optional local copy of the IETF leap-seconds.list file,
+#: used in preference to the bundled table until the file expires.
+leap_seconds_cache = os.environ.get('TERRA_LEAP_SECONDS_LIST')
+
+# The leap second table bundled with terra, in leap-seconds.list format.
+_bundled_leap_seconds = ('2272060800	10	# 1 Jan 1972\n'
+                         '2287785600	11	# 1 Jul 1972\n'
+                         '2303683200	12	# 1 Jan 1973\n'
+                         '2335219200	13	# 1 Jan 1974\n'
+                         '2366755200	14	# 1 Jan 1975\n'
+                         '2398291200	15	# 1 Jan 1976\n'
+                         '2429913600	16	# 1 Jan 1977\n'
+                         '2461449600	17	# 1 Jan 1978\n'
+                         '2492985600	18	# 1 Jan 1979\n'
+                         '2524521600	19	# 1 Jan 1980\n'
+                         '2571782400	20	# 1 Jul 1981\n'
+                         '2603318400	21	# 1 Jul 1982\n'
+                         '2634854400	22	# 1 Jul 1983\n'
+                         '2698012800	23	# 1 Jul 1985\n'
+                         '2776982400	24	# 1 Jan 1988\n'
+                         '2840140800	25	# 1 Jan 1990\n'
+                         '2871676800	26	# 1 Jan 1991\n'
+                         '2918937600	27	# 1 Jul 1992\n'
+                         '2950473600	28	# 1 Jul 1993\n'
+                         '2982009600	29	# 1 Jul 1994\n'
+                         '3029443200	30	# 1 Jan 1996\n'
+                         '3076704000	31	# 1 Jul 1997\n'
+                         '3124137600	32	# 1 Jan 1999\n'
+                         '3345062400	33	# 1 Jan 2006\n'
+                         '3439756800	34	# 1 Jan 2009\n'
+                         '3550089600	35	# 1 Jul 2012\n'
+                         '3644697600	36	# 1 Jul 2015\n'
+                         '3692217600	37	# 1 Jan 2017\n')
+
+# The leap second table of this process, loaded on first use.
+_leap_seconds = None
+
+# The difference between the NTP epoch, 1900-01-01, and the Unix epoch.
+_NTP_UNIX_OFFSET = 2208988800
+
+
+def parse_leap_seconds_list(text):
+    """
+    Return the leap seconds from the text of a leap-seconds.list file,
+    as a list of (day, month, year) tuples, and the expiry time of the
+    list in NTP seconds, or None if the list has no expiry line.
+
+    """
+    table = []
+    expiry = None
+    for line in text.split('\n'):
+        if line.startswith('#@'):
+            expiry = int(line[2:].split()[0])
+        elif line.strip() and not line.startswith('#'):
+            day, month, year = line.split('#')[1].split()[0:3]
+            table.append((int(day), month, int(year)))
+    return table, expiry
+
+
+def _load_leap_seconds(path=None):
+    # Return the leap seconds of the list at path, if it exists and has
+    # not expired, otherwise the bundled leap seconds.
+    table, expiry = parse_leap_seconds_list(_bundled_leap_seconds)
+    if path is not None and os.path.isfile(path):
+        with open(path) as cache:
+            cached, expiry = parse_leap_seconds_list(cache.read())
+        if expiry is not None and expiry < _time.time() + _NTP_UNIX_OFFSET:
+            msg = ('The leap second list {} has expired, using the bundled '
+                   'leap second table; see '
+                   'terra.datetime.refresh_leap_seconds.'.format(path))
+            warnings.warn(msg)
+        elif cached:
+            table = cached
+    return table
+
+
+def leap_seconds():
+    """
+    Return the leap seconds of this process, as a list of
+    (day, month, year) tuples.
+
+    The table is loaded once, on first use, from the file at
+    :data:`leap_seconds_cache` if it is set and the file has not expired,
+    or from the table bundled with terra.  The network is never used.
+
+    """
+    global _leap_seconds
+    if _leap_seconds is None:
+        _leap_seconds = _load_leap_seconds(leap_seconds_cache)
+    return _leap_seconds
+
+
+def refresh_leap_seconds(path=None, url=IETF_LEAP_SECONDS_URL, timeout=10):
+    """
+    Download the leap seconds list and use it for ISOGregorian calendars
+    subsequently created by this process.
+
+    Kwargs:
+
+        * path - the file to store the downloaded list in, defaults to
+                 :data:`leap_seconds_cache`.
+        * url - the location of the leap-seconds.list file.
+        * timeout - the number of seconds to wait for the server.
+
+    Requires the requests package.
+
+    """
+    global _leap_seconds
+    import requests
+    response = requests.get(url, timeout=timeout)
+    response.raise_for_status()
+    table, expiry = parse_leap_seconds_list(response.text)
+    if not table:
+        raise ValueError('No leap seconds found at {}.'.format(url))
+    if path is None:
+        path = leap_seconds_cache
+    if path is not None:
+        with open(path, 'w') as cache:
+            cache.write(response.text)
+    _leap_seconds = table
+    # Subsequent ISOGregorian calendars are created with the new table.
+    _calendars.pop(ISOGregorian, None)
+    return table
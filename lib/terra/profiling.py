@@ -0,0 +1,228 @@
+"""
+Opt-in instrumentation of the terra parse and conversion paths.
+
+Each instrumented function records its number of calls, the number of
+elements it handled and its cumulative wall time.  Instrumentation is off
+by default: the instrumented functions are only replaced by timed wrappers
+while it is enabled, so it costs nothing when disabled.
+
+    import terra.profiling
+
+    with terra.profiling.profile():
+        crs = terra.parse_wktcrs(wkt)
+        strings = crs.datetime_strings(values)
+    print(terra.profiling.to_json(indent=2))
+
+Times are cumulative, so the time of a call includes the time of the
+instrumented calls it makes.  Functions bound by name before
+instrumentation is enabled, such as with ``from terra import
+parse_wktcrs``, and calls made in worker processes, are not recorded.
+
+"""
+import contextlib
+import functools
+import json
+import threading
+import timeit
+
+import numpy as np
+
+import terra
+import terra.datetime
+
+
+# The instrumentation points, as (owner, name, elements) tuples, by key.
+_points = {}
+
+# The [calls, elements, seconds] counters of the instrumentation points.
+_counters = {}
+
+# The original attributes of the instrumented owners while enabled.
+_originals = {}
+
+# The number of profile blocks being executed.
+_depth = 0
+
+_lock = threading.Lock()
+
+_timer = timeit.default_timer
+
+
+def instrument(owner, name, elements=None, key=None):
+    """
+    Register the function or method name of a module or class as an
+    instrumentation point, and return its key.
+
+    Args:
+
+        * owner - the module or class the function is an attribute of.
+        * name - the name of the function.
+
+    Kwargs:
+
+        * elements - a function of the result and the arguments of a call
+                     returning the number of elements it handled, by
+                     default one.  Calls which raise, or for which
+                     elements raises, count no elements.
+        * key - the name of the instrumentation point, by default the
+                qualified name of the function.
+
+    """
+    if key is None:
+        key = '{}.{}'.format(owner.__name__, name)
+        if isinstance(owner, type):
+            key = '{}.{}'.format(owner.__module__, key)
+    if name not in vars(owner):
+        raise ValueError('{} has no attribute {} of its own.'.format(owner,
+                                                                     name))
+    with _lock:
+        _points[key] = (owner, name, elements)
+        _counters.setdefault(key, [0, 0, 0.0])
+        if enabled() and key not in _originals:
+            _patch(key)
+    return key
+
+
+def _wrap(func, counter, elements):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        count = 0
+        start = _timer()
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            seconds = _timer() - start
+            with _lock:
+                counter[0] += 1
+                counter[2] += seconds
+        if elements is None:
+            count = 1
+        else:
+            # Counting must never change the behaviour of the call.
+            try:
+                count = int(elements(result, *args, **kwargs))
+            except Exception:
+                pass
+        with _lock:
+            counter[1] += count
+        return result
+    return wrapper
+
+
+def _patch(key):
+    owner, name, elements = _points[key]
+    original = vars(owner)[name]
+    if isinstance(original, (classmethod, staticmethod)):
+        wrapped = type(original)(_wrap(original.__func__, _counters[key],
+                                       elements))
+    else:
+        wrapped = _wrap(original, _counters[key], elements)
+    _originals[key] = original
+    setattr(owner, name, wrapped)
+
+
+def enabled():
+    """Return True while instrumentation is enabled."""
+    return bool(_originals)
+
+
+def _enable():
+    for key in _points:
+        if key not in _originals:
+            _patch(key)
+
+
+def enable():
+    """Instrument every registered function."""
+    with _lock:
+        _enable()
+
+
+def _disable():
+    # In reverse, to unwind functions instrumented more than once.
+    for key, original in reversed(list(_originals.items())):
+        owner, name, _ = _points[key]
+        setattr(owner, name, original)
+        del _originals[key]
+
+
+def disable():
+    """Restore every instrumented function, keeping the counts."""
+    with _lock:
+        _disable()
+
+
+def reset():
+    """Set every count and time to zero."""
+    with _lock:
+        for counter in _counters.values():
+            counter[:] = [0, 0, 0.0]
+
+
+@contextlib.contextmanager
+def profile(reset_counts=True):
+    """
+    Return a context manager which enables instrumentation for the
+    duration of its block, setting the counts to zero first unless
+    reset_counts is False.  Blocks may be nested: instrumentation stays
+    enabled until the outermost block exits.
+
+    """
+    global _depth
+    if reset_counts:
+        reset()
+    with _lock:
+        _depth += 1
+        _enable()
+    try:
+        yield
+    finally:
+        with _lock:
+            _depth -= 1
+            if not _depth:
+                _disable()
+
+
+def snapshot():
+    """
+    Return a dictionary of the calls, elements and seconds of each
+    instrumentation point which has been called, by key.
+
+    """
+    with _lock:
+        result = dict((key, {'calls': calls, 'elements': count,
+                             'seconds': seconds})
+                      for key, (calls, count, seconds) in _counters.items()
+                      if calls)
+    return result
+
+
+def to_json(**kwargs):
+    """
+    Return the :func:`snapshot` as a JSON string, passing any keyword
+    arguments on to :func:`json.dumps`.
+
+    """
+    kwargs.setdefault('sort_keys', True)
+    return json.dumps(snapshot(), **kwargs)
+
+
+def _size(result, self, *args, **kwargs):
+    return self.size
+
+
+def _parsed(result, *args, **kwargs):
+    # The malformed flags, which have an element for each string.
+    return np.size(result[1])
+
+
+instrument(terra, 'parse_wktcrs')
+instrument(terra.datetime, 'parse_datetime')
+instrument(terra.datetime, 'parse_datetimes', _parsed)
+instrument(terra.datetime, '_load_leap_seconds')
+instrument(terra.datetime.Calendar, '__init__')
+instrument(terra.datetime.EpochDateTimes, 'ordinals_ticks', _size)
+instrument(terra.datetime.EpochDateTimes, 'datetimes', _size)
+for _cls in [terra.datetime.date, terra.datetime.datetime]:
+    instrument(_cls, '__add__')
+    instrument(_cls, '__sub__')
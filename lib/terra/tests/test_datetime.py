@@ -1,5 +1,13 @@
 
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import time
 import unittest
+import warnings
+
 import numpy as np
 
 import terra.datetime as datetime
@@ -19,6 +27,158 @@ class Testdate(unittest.TestCase):
         adate = datetime.date(2001, 8, 7)
         self.assertEqual(str(adate), '2001-08-07')
 
+class TestdateArithmetic(unittest.TestCase):
+    def test_add_days(self):
+        adate = datetime.date(2001, 8, 7)
+        self.assertEqual(str(adate + datetime.timedelta(days=3683)),
+                         '2011-09-07')
+
+    def test_sub_days(self):
+        adate = datetime.date(2011, 9, 7)
+        self.assertEqual(str(adate - datetime.timedelta(days=3683)),
+                         '2001-08-07')
+
+    def test_add_days_leap_year(self):
+        adate = datetime.date(2000, 2, 28,
+                              calendar=datetime.GregorianNoLeapSecond())
+        self.assertEqual(str(adate + datetime.timedelta(days=1)),
+                         '2000-02-29')
+
+    def test_add_days_360(self):
+        adate = datetime.date(2000, 2, 28, calendar=datetime.G360Day())
+        self.assertEqual(str(adate + datetime.timedelta(days=365)),
+                         '2001-03-03')
+
+    def test_add_months(self):
+        adate = datetime.date(2001, 8, 7)
+        self.assertEqual(str(adate + datetime.timedelta(months=29)),
+                         '2004-01-07')
+
+    def test_sub_months(self):
+        adate = datetime.date(2001, 8, 7)
+        self.assertEqual(str(adate - datetime.timedelta(months=20)),
+                         '1999-12-07')
+
+    def test_add_months_null_year(self):
+        adate = datetime.date(-1, 12, 1,
+                              calendar=datetime.GregorianNoLeapSecond())
+        self.assertEqual((adate + datetime.timedelta(months=1)).year, 1)
+
+    def test_add_years(self):
+        adate = datetime.date(2001, 8, 7)
+        self.assertEqual(str(adate + datetime.timedelta(years=3)),
+                         '2004-08-07')
+
+    def test_add_months_end_of_month(self):
+        adate = datetime.date(2000, 1, 31,
+                              calendar=datetime.GregorianNoLeapSecond())
+        self.assertEqual(str(adate + datetime.timedelta(months=1)),
+                         '2000-02-29')
+
+
+class TestdatetimeArithmetic(unittest.TestCase):
+    def setUp(self):
+        self.calendar = datetime.ISOGregorian()
+
+    def test_add_seconds_leap_second(self):
+        adatetime = datetime.datetime(2016, 12, 31, 23, 59, 59,
+                                      calendar=self.calendar)
+        result = adatetime + datetime.timedelta(seconds=2)
+        self.assertEqual(str(result), '2017-01-01T00:00:00')
+
+    def test_sub_seconds_leap_second(self):
+        adatetime = datetime.datetime(2017, 1, 1, calendar=self.calendar)
+        result = adatetime + datetime.timedelta(seconds=-2)
+        self.assertEqual(str(result), '2016-12-31T23:59:59')
+
+    def test_add_hours_carry(self):
+        adatetime = datetime.datetime(2001, 8, 7, 12)
+        result = adatetime + datetime.timedelta(hours=13)
+        self.assertEqual(str(result), '2001-08-08T01:00:00')
+
+    def test_add_minutes(self):
+        adatetime = datetime.datetime(2001, 8, 7, 12, 30)
+        result = adatetime + datetime.timedelta(minutes=-45)
+        self.assertEqual(str(result), '2001-08-07T11:45:00')
+
+    def test_add_float_seconds(self):
+        adatetime = datetime.datetime(2001, 8, 7)
+        result = adatetime + datetime.timedelta(seconds=1.5)
+        self.assertEqual(str(result), '2001-08-07T00:00:01.500000')
+
+    def test_leapseconds_elapsed_array(self):
+        ordinal = self.calendar.date_to_ordinal(2016, 12, 31)
+        elapsed = np.array((-10**9, 0, 1, 2, 10**9))
+        result = self.calendar.leapseconds_elapsed(ordinal, 86399, elapsed)
+        np.testing.assert_array_equal(result, [-14, 0, 1, 1, 1])
+
+
+class TestCalendarOrdinal(unittest.TestCase):
+    def test_round_trip(self):
+        for calendar in [datetime.G360Day(), datetime.G365Day(),
+                         datetime.GregorianNoLeapSecond()]:
+            for ordinal in range(-1000, 1000000, 997):
+                ymd = calendar.ordinal_to_date(ordinal)
+                self.assertEqual(calendar.date_to_ordinal(*ymd), ordinal)
+
+    def test_0d_ordinals(self):
+        calendar = datetime.GregorianNoLeapSecond()
+        result = calendar.ordinals_to_dates(np.array(730000))
+        self.assertEqual([int(value) for value in result],
+                         list(calendar.ordinal_to_date(730000)))
+
+    def test_gregorian_null_year(self):
+        calendar = datetime.GregorianNoLeapSecond()
+        self.assertEqual(calendar.ordinal_to_date(-1), (-1, 12, 31))
+        self.assertEqual(calendar.ordinal_to_date(0), (1, 1, 1))
+
+    def test_leap_year_table(self):
+        calendar = Julian()
+        years = np.array([-20003, -9999, -1, 1, 2, 2000, 10000, 10005])
+        expected = [sum(1 for year in range(1, y) if year % 4 == 0) if y > 1
+                    else -sum(1 for year in range(y, 1) if year % 4 == 0)
+                    for y in years]
+        self.assertEqual(calendar.leap_years_before(years).tolist(), expected)
+        self.assertEqual([calendar.leap_years_before(int(y)) for y in years],
+                         expected)
+        self.assertEqual(calendar.leap_year_mask(years).tolist(),
+                         [y % 4 == 0 for y in years])
+
+    def test_month_index(self):
+        calendar = datetime.G365Day()
+        index = calendar.month_index(2001, 8)
+        self.assertEqual(calendar.index_month(index + 5), (2002, 1))
+
+
+class TestCalendarDuration(unittest.TestCase):
+    def test_days_century(self):
+        adate = datetime.date(1901, 3, 1)
+        bdate = datetime.date(2001, 3, 1)
+        self.assertEqual((bdate - adate).days, 36525)
+
+    def test_days_negative(self):
+        adate = datetime.date(2001, 8, 7)
+        bdate = datetime.date(2001, 9, 7)
+        self.assertEqual((adate - bdate).days, -31)
+
+    def test_days_360(self):
+        calendar = datetime.G360Day()
+        adate = datetime.date(2001, 8, 7, calendar=calendar)
+        bdate = datetime.date(2011, 9, 7, calendar=calendar)
+        self.assertEqual((bdate - adate).days, 3630)
+
+    def test_total_seconds_microseconds(self):
+        adate = datetime.datetime(2001, 8, 7, 1, 2, 3, 500000)
+        bdate = datetime.datetime(2001, 8, 8, 1, 2, 4)
+        self.assertEqual((bdate - adate).total_seconds(), 86400.5)
+
+    def test_total_seconds_leapseconds(self):
+        calendar = datetime.ISOGregorian()
+        adate = datetime.datetime(2001, 8, 7, calendar=calendar)
+        bdate = datetime.datetime(2011, 9, 6, 23, 59, 58, calendar=calendar)
+        self.assertEqual((bdate - adate).total_seconds(), 318211200)
+
+
 class TestOffset(unittest.TestCase):
     def test_many_seconds(self):
         origin = '1970-01-01 00:00:00Z'
@@ -38,6 +198,898 @@ class TestOffset(unittest.TestCase):
                          "['2017-12-19T08:55:03' '2017-12-19T08:55:07']")
 
 
+class TestCalendarRegistry(unittest.TestCase):
+    def test_interned(self):
+        self.assertIs(datetime.ISOGregorian(), datetime.ISOGregorian())
+        self.assertIs(datetime.get_calendar('G360Day'), datetime.G360Day())
+
+    def test_immutable(self):
+        calendar = datetime.G365Day()
+        with self.assertRaises(AttributeError):
+            calendar.null_years = [1]
+
+    def test_equality(self):
+        self.assertNotEqual(datetime.ISOGregorian(),
+                            datetime.GregorianNoLeapSecond())
+        self.assertNotEqual(datetime.GregorianNoLeapSecond(),
+                            datetime.ISOGregorian())
+        calendars = {datetime.G360Day(): 360, datetime.G365Day(): 365}
+        self.assertEqual(calendars[datetime.G365Day()], 365)
+
+    def test_leap_second_equality(self):
+        before = datetime.ISOGregorian()
+        table = datetime.leap_seconds()
+        try:
+            # As refresh_leap_seconds does, with one more leap second.
+            datetime._leap_seconds = table + [(1, 'Jan', 2030)]
+            datetime._calendars.pop(datetime.ISOGregorian)
+            after = datetime.ISOGregorian()
+            self.assertNotEqual(before, after)
+            self.assertEqual(len(set([before, after])), 2)
+        finally:
+            datetime._leap_seconds = table
+            datetime._calendars[datetime.ISOGregorian] = before
+        with self.assertRaises(TypeError):
+            datetime.GregorianNoLeapSecond(table)
+
+    def test_month_names(self):
+        adate = datetime.date(2001, 'Aug', 7,
+                              calendar=datetime.GregorianNoLeapSecond())
+        self.assertEqual(adate.month, 8)
+
+
+class TestEpochDateTimesComponents(unittest.TestCase):
+    def test_360_day(self):
+        epoch = datetime.datetime(2000, 1, 1, calendar=datetime.G360Day())
+        sample = datetime.EpochDateTimes(np.array((0, 59, 360, 719)),
+                                         'days', epoch=epoch)
+        years, months, days = sample.components()[:3]
+        np.testing.assert_array_equal(years, [2000, 2000, 2001, 2001])
+        np.testing.assert_array_equal(months, [1, 2, 1, 12])
+        np.testing.assert_array_equal(days, [1, 30, 1, 30])
+
+    def test_minutes_carry(self):
+        epoch = datetime.datetime(2001, 12, 31, 23, 30,
+                                  calendar=datetime.G365Day())
+        sample = datetime.EpochDateTimes(np.array((45,)), 'minutes',
+                                         epoch=epoch)
+        self.assertEqual(str(sample), '2002-01-01T00:15:00')
+
+    def test_negative_seconds(self):
+        epoch = datetime.datetime(2001, 3, 1,
+                                  calendar=datetime.GregorianNoLeapSecond())
+        sample = datetime.EpochDateTimes(np.array((-1,)), 'seconds',
+                                         epoch=epoch)
+        self.assertEqual(str(sample), '2001-02-28T23:59:59')
+
+    def test_leap_second(self):
+        epoch = datetime.datetime(2016, 12, 31, 23, 59, 59,
+                                  calendar=datetime.ISOGregorian())
+        sample = datetime.EpochDateTimes(np.array((0, 1, 2)), 'seconds',
+                                         epoch=epoch)
+        self.assertEqual(str(sample), "['2016-12-31T23:59:59' "
+                         "'2016-12-31T23:59:59' '2017-01-01T00:00:00']")
+
+
+class TestDatetimeArray(unittest.TestCase):
+    def setUp(self):
+        self.calendar = datetime.G365Day()
+        self.array = datetime.DatetimeArray.from_components(
+            [2001, 2000, 2001], [3, 12, 3], [1, 31, 1], hours=[6, 0, 6],
+            calendar=self.calendar)
+
+    def test_components(self):
+        self.assertEqual(self.array.shape, (3,))
+        np.testing.assert_array_equal(self.array.year, [2001, 2000, 2001])
+        np.testing.assert_array_equal(self.array.hour, [6, 0, 6])
+
+    def test_getitem(self):
+        item = self.array[1]
+        self.assertIsInstance(item, datetime.datetime)
+        self.assertEqual(str(item), '2000-12-31T00:00:00')
+        subset = self.array[self.array.year == 2001]
+        self.assertIsInstance(subset, datetime.DatetimeArray)
+        self.assertEqual(len(subset), 2)
+
+    def test_compare(self):
+        moment = datetime.datetime(2001, 1, 1, calendar=self.calendar)
+        np.testing.assert_array_equal(self.array > moment,
+                                      [True, False, True])
+        np.testing.assert_array_equal(self.array == self.array[[0, 0, 1]],
+                                      [True, False, False])
+
+    def test_compare_calendars(self):
+        moment = datetime.datetime(2001, 1, 1, calendar=datetime.G360Day())
+        with self.assertRaises(NotImplementedError):
+            self.array < moment
+
+    def test_sort_search(self):
+        ordered = self.array.sort()
+        np.testing.assert_array_equal(ordered.year, [2000, 2001, 2001])
+        moment = datetime.datetime(2001, 3, 1, 6, calendar=self.calendar)
+        self.assertEqual(ordered.searchsorted(moment), 1)
+        self.assertEqual(ordered.searchsorted(moment, side='right'), 3)
+
+    def test_unique(self):
+        unique, inverse = self.array.unique(return_inverse=True)
+        self.assertEqual(len(unique), 2)
+        np.testing.assert_array_equal(inverse, [1, 0, 1])
+
+    def test_strings(self):
+        self.assertEqual(self.array.strings().tolist(),
+                         ['2001-03-01T06:00:00', '2000-12-31T00:00:00',
+                          '2001-03-01T06:00:00'])
+
+    def test_from_epoch(self):
+        epoch = datetime.datetime(2000, 1, 1, calendar=self.calendar)
+        sample = datetime.EpochDateTimes(np.array([[0, 1], [365, 366]]),
+                                         'days', epoch=epoch)
+        result = sample.datetime_array()
+        self.assertEqual(result.shape, (2, 2))
+        np.testing.assert_array_equal(result.year, [[2000, 2000],
+                                                    [2001, 2001]])
+        moments = [epoch, datetime.datetime(2000, 1, 2,
+                                            calendar=self.calendar)]
+        from_datetimes = datetime.DatetimeArray.from_datetimes(
+            moments, calendar=self.calendar)
+        np.testing.assert_array_equal(from_datetimes == result[0],
+                                      [True, True])
+
+
+class TestFrozen(unittest.TestCase):
+    def setUp(self):
+        self.calendar = datetime.G365Day()
+        self.moment = datetime.frozendatetime(2001, 2, 3, 4, 5, 6.5,
+                                              calendar=self.calendar)
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.moment.year = 2002
+        self.assertFalse(hasattr(self.moment, '__dict__'))
+
+    def test_hash(self):
+        other = datetime.datetime(2001, 2, 3, 4, 5, 6.5,
+                                  calendar=self.calendar).freeze()
+        self.assertEqual(len({self.moment, other}), 1)
+        self.assertEqual(self.moment.microsecond, 500000)
+
+    def test_rounded_seconds(self):
+        moment = datetime.frozentime(1, 2, 3.9999999)
+        self.assertEqual((moment.second, moment.microsecond), (4, 0))
+        self.assertEqual(str(moment), '01:02:04')
+        self.assertEqual(moment, datetime.frozentime(1, 2, 4))
+        moment = datetime.frozendatetime(2001, 2, 3, 4, 5, 6.9999999,
+                                         calendar=self.calendar)
+        self.assertEqual(str(moment), '2001-02-03T04:05:07')
+        self.assertEqual(moment, datetime.frozendatetime(
+            2001, 2, 3, 4, 5, 7, calendar=self.calendar))
+
+    def test_order(self):
+        moments = [self.moment + datetime.timedelta(days=n)
+                   for n in (3, -1, 2)]
+        self.assertEqual([moment.day for moment in sorted(moments)],
+                         [2, 5, 6])
+        self.assertTrue(datetime.frozentime(1, 2, 3) <
+                        datetime.frozentime(1, 2, 4))
+        self.assertTrue(datetime.frozendate(2000, 12, 31, self.calendar) <
+                        self.moment.date)
+
+    def test_calendars(self):
+        other = datetime.frozendatetime(2001, 2, 3,
+                                        calendar=datetime.G360Day())
+        with self.assertRaises(NotImplementedError):
+            self.moment < other
+
+    def test_mixed_calendars(self):
+        day_360 = datetime.frozendate(2000, 1, 1, datetime.G360Day())
+        ordinal = day_360.thaw().calendar.date_to_ordinal(2000, 1, 1)
+        calendar = datetime.G365Day()
+        day_365 = datetime.frozendate(*calendar.ordinal_to_date(ordinal),
+                                      calendar=calendar)
+        self.assertEqual(hash(day_360), hash(day_365))
+        self.assertEqual(len({day_360, day_365}), 2)
+        self.assertNotEqual(day_360, day_365)
+        dates = {datetime.frozendate(2000, 1, 1): 1}
+        self.assertIsNone(dates.get(datetime.frozendate(
+            2000, 1, 1, datetime.GregorianNoLeapSecond())))
+
+    def test_pickle(self):
+        self.assertEqual(pickle.loads(pickle.dumps(self.moment)), self.moment)
+
+    def test_thaw(self):
+        thawed = self.moment.thaw()
+        self.assertIsInstance(thawed, datetime.datetime)
+        self.assertEqual(str(thawed), str(self.moment))
+
+
+class TestParseDatetimes(unittest.TestCase):
+    def setUp(self):
+        self.calendar = datetime.GregorianNoLeapSecond()
+        self.strings = ['2001-02-03T04:05:06', '1999-12-31 23:59:59.25',
+                        '2000-02-29', '2001-02-29', 'junk', '',
+                        '2001-1-2T03:04:05', '0000-01-01']
+
+    def test_components(self):
+        components, malformed, tsep = datetime.parse_datetime_components(
+            np.array(self.strings), self.calendar)
+        np.testing.assert_array_equal(components[0][:3], [2001, 1999, 2000])
+        np.testing.assert_array_equal(components[3][:3], [4, 23, 0])
+        np.testing.assert_array_equal(components[6][:3], [0, 250000, 0])
+        np.testing.assert_array_equal(malformed, [False, False, False, True,
+                                                  True, True, False, True])
+        self.assertEqual(tsep, 'T')
+
+    def test_bytes(self):
+        result, malformed = datetime.parse_datetimes(
+            np.array(self.strings, dtype='S'), self.calendar)
+        self.assertEqual(str(result[6]), '2001-01-02T03:04:05')
+        self.assertEqual(malformed.sum(), 4)
+
+    def test_calendar(self):
+        result, malformed = datetime.parse_datetimes(self.strings,
+                                                     datetime.G360Day())
+        self.assertEqual(str(result[3]), '2001-02-29T00:00:00')
+        np.testing.assert_array_equal(malformed, [False, True, False, False,
+                                                  True, True, False, False])
+
+    def test_empty(self):
+        for strings in [[], np.array([], dtype='U19'),
+                        np.array([], dtype='S19')]:
+            result, malformed = datetime.parse_datetimes(strings,
+                                                         self.calendar)
+            self.assertEqual(result.shape, (0,))
+            self.assertEqual(malformed.shape, (0,))
+
+    def test_iterable(self):
+        strings = (string for string in self.strings)
+        result, malformed = datetime.parse_datetimes(strings, self.calendar)
+        self.assertEqual(str(result[0]), '2001-02-03T04:05:06')
+        self.assertEqual(malformed.sum(), 4)
+
+
+class TestEpochDateTimesMasked(unittest.TestCase):
+    def setUp(self):
+        epoch = datetime.datetime(2000, 1, 1, calendar=datetime.G365Day())
+        self.epoch = epoch
+        offsets = np.ma.masked_array([0, 1, 2, 3], mask=[0, 1, 0, 0])
+        self.sample = datetime.EpochDateTimes(offsets, 'days', epoch=epoch)
+
+    def test_datetimes(self):
+        result = self.sample.datetimes()
+        self.assertIsInstance(result, np.ma.MaskedArray)
+        np.testing.assert_array_equal(result.mask, [False, True, False,
+                                                    False])
+        self.assertEqual(result[2], '2000-01-03T00:00:00')
+
+    def test_components(self):
+        years = self.sample.components()[0]
+        np.testing.assert_array_equal(years.mask, self.sample.mask)
+        self.assertEqual(years.count(), 3)
+
+    def test_datetime_array(self):
+        result = self.sample.datetime_array()
+        self.assertIs(result[1], np.ma.masked)
+        np.testing.assert_array_equal(result.argsort(), [0, 2, 3, 1])
+        unique, inverse = result.unique(return_inverse=True)
+        self.assertEqual(len(unique), 3)
+        self.assertIs(inverse[1], np.ma.masked)
+
+    def test_single_masked(self):
+        offsets = np.ma.masked_array([5], mask=[1])
+        sample = datetime.EpochDateTimes(offsets, 'days', epoch=self.epoch)
+        self.assertEqual(str(sample), '[--]')
+
+
+class TestEpochDateTimesFloat(unittest.TestCase):
+    def setUp(self):
+        self.epoch = datetime.datetime(
+            2000, 1, 1, calendar=datetime.GregorianNoLeapSecond())
+
+    def test_days(self):
+        sample = datetime.EpochDateTimes(np.array([0.5, 1.25, -0.25]),
+                                         'days', epoch=self.epoch)
+        self.assertEqual(sample.datetimes().tolist(),
+                         ['2000-01-01T12:00:00', '2000-01-02T06:00:00',
+                          '1999-12-31T18:00:00'])
+
+    def test_hours(self):
+        sample = datetime.EpochDateTimes(np.array(2.5), 'hours',
+                                         epoch=self.epoch)
+        self.assertEqual(str(sample), '2000-01-01T02:30:00')
+
+    def test_microseconds(self):
+        sample = datetime.EpochDateTimes(np.array([1.5e-6, 36524.0000001]),
+                                         'seconds', epoch=self.epoch)
+        ticks = sample.ordinals_ticks()[1]
+        np.testing.assert_array_equal(ticks % 1000000, [2, 0])
+
+    def test_nan(self):
+        sample = datetime.EpochDateTimes(np.array([np.nan, 1.0]), 'days',
+                                         epoch=self.epoch)
+        np.testing.assert_array_equal(sample.datetimes().mask,
+                                      [True, False])
+
+
+class TestEpochDateTimesLazy(unittest.TestCase):
+    def setUp(self):
+        self.epoch = datetime.datetime(2000, 1, 1,
+                                       calendar=datetime.G365Day())
+
+    def test_getitem(self):
+        sample = datetime.EpochDateTimes(np.arange(48), 'hours',
+                                         epoch=self.epoch)
+        self.assertEqual(len(sample), 48)
+        self.assertEqual(str(sample[25]), '2000-01-02T01:00:00')
+        self.assertEqual(str(sample[24:26]),
+                         "['2000-01-02T00:00:00' '2000-01-02T01:00:00']")
+
+    def test_iter(self):
+        sample = datetime.EpochDateTimes(np.arange(5000), 'minutes',
+                                         epoch=self.epoch)
+        items = list(sample)
+        self.assertEqual(len(items), 5000)
+        self.assertEqual(str(items[-1]), '2000-01-04T11:19:00')
+
+    def test_summary(self):
+        sample = datetime.EpochDateTimes(np.arange(10 ** 7), 'seconds',
+                                         epoch=self.epoch)
+        self.assertEqual(repr(sample),
+                         "['2000-01-01T00:00:00' '2000-01-01T00:00:01' "
+                         "'2000-01-01T00:00:02' ... '2000-04-26T17:46:37' "
+                         "'2000-04-26T17:46:38' '2000-04-26T17:46:39']")
+
+    def test_summary_2d(self):
+        offsets = np.ma.masked_array(np.arange(2000).reshape(20, 100))
+        offsets[0, 0] = np.ma.masked
+        sample = datetime.EpochDateTimes(offsets, 'days', epoch=self.epoch)
+        lines = str(sample).split('\n')
+        self.assertEqual(len(lines), 7)
+        self.assertTrue(lines[0].startswith("[[-- '2000-01-02T00:00:00'"))
+        self.assertEqual(lines[3], ' ...')
+
+
+class TestEpochDateTimesChunks(unittest.TestCase):
+    def setUp(self):
+        epoch = datetime.datetime(2000, 1, 1, calendar=datetime.G365Day())
+        self.sample = datetime.EpochDateTimes(np.arange(10).reshape(2, 5),
+                                              'hours', epoch=epoch)
+
+    def test_chunks(self):
+        chunks = list(self.sample.iter_chunks(4))
+        self.assertEqual([len(chunk) for chunk in chunks], [4, 4, 2])
+        self.assertEqual(np.concatenate(chunks).tolist(),
+                         self.sample.datetimes().ravel().tolist())
+
+    def test_out(self):
+        out = np.zeros((2, 5), dtype='S26')
+        chunks = list(self.sample.iter_chunks(3, out=out))
+        self.assertTrue(np.shares_memory(chunks[-1], out))
+        self.assertEqual(out[1, 4], b'2000-01-01T09:00:00')
+
+    def test_narrow_out(self):
+        out = np.zeros(10, dtype='U10')
+        with self.assertRaises(ValueError):
+            list(self.sample.iter_chunks(3, out=out))
+
+    def test_empty(self):
+        sample = datetime.EpochDateTimes(np.array([], dtype=int), 'days',
+                                         epoch=self.sample.epoch)
+        self.assertEqual(sample.datetimes().shape, (0,))
+        self.assertEqual(list(sample.iter_chunks(4)), [])
+
+
+class TestEpochDateTimesFiles(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.epoch = datetime.datetime(2000, 1, 1,
+                                       calendar=datetime.G365Day())
+        self.path = os.path.join(self.tmpdir, 'offsets.bin')
+        np.arange(-2, 8, dtype='<i4').tofile(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_from_file(self):
+        sample = datetime.EpochDateTimes.from_file(
+            self.path, 'days', self.epoch, dtype='<i4', shape=(2, 4), offset=8)
+        self.assertIsInstance(sample.offsets.offsets, np.memmap)
+        self.assertEqual(str(sample[1, 3]), '2000-01-08T00:00:00')
+
+    def test_write_strings(self):
+        sample = datetime.EpochDateTimes.from_file(self.path, 'days',
+                                                   self.epoch, dtype='<i4')
+        path = os.path.join(self.tmpdir, 'strings.bin')
+        sample.write_strings(path, chunk_size=3)
+        result = np.fromfile(path, dtype='S26')
+        self.assertEqual(result[0], b'1999-12-30T00:00:00')
+        self.assertEqual(result.tolist(),
+                         sample.datetimes().astype('S').tolist())
+
+    def test_write_components(self):
+        sample = datetime.EpochDateTimes.from_file(self.path, 'hours',
+                                                   self.epoch, dtype='<i4')
+        path = os.path.join(self.tmpdir, 'components.bin')
+        sample.write_components(path, chunk_size=4)
+        result = np.fromfile(path, dtype=datetime.component_dtype)
+        np.testing.assert_array_equal(result['hour'],
+                                      [22, 23, 0, 1, 2, 3, 4, 5, 6, 7])
+        np.testing.assert_array_equal(result['year'][:3], [1999, 1999, 2000])
+
+
+class TestEpochDateTimesSearch(unittest.TestCase):
+    def setUp(self):
+        self.calendar = datetime.G360Day()
+        self.epoch = datetime.datetime(2000, 1, 1, calendar=self.calendar)
+
+    def moment(self, *args):
+        return datetime.datetime(*args, calendar=self.calendar)
+
+    def test_searchsorted(self):
+        sample = datetime.EpochDateTimes(np.arange(0, 240, 6), 'hours',
+                                         epoch=self.epoch)
+        self.assertEqual(sample.searchsorted(self.moment(2000, 1, 2, 1)), 5)
+        self.assertEqual(sample.searchsorted(self.moment(2000, 1, 2)), 4)
+        self.assertEqual(sample.searchsorted(self.moment(2000, 1, 2),
+                                             side='right'), 5)
+
+    def test_select(self):
+        sample = datetime.EpochDateTimes(np.arange(720), 'days',
+                                         epoch=self.epoch)
+        subset = sample.select(self.moment(2000, 3, 1),
+                               self.moment(2001, 1, 1))
+        self.assertEqual(len(subset), 300)
+        self.assertEqual(str(subset[0]), '2000-03-01T00:00:00')
+        self.assertEqual(len(sample.select(end=self.moment(1999, 1, 1))), 0)
+
+    def test_float(self):
+        sample = datetime.EpochDateTimes(np.arange(0, 10, 0.5), 'days',
+                                         epoch=self.epoch)
+        self.assertEqual(sample.searchsorted(self.moment(2000, 1, 2, 6)), 3)
+
+    def test_leap_seconds(self):
+        calendar = datetime.ISOGregorian()
+        epoch = datetime.datetime(2016, 12, 31, calendar=calendar)
+        sample = datetime.EpochDateTimes(np.arange(86402), 'seconds',
+                                         epoch=epoch)
+        moment = datetime.datetime(2017, 1, 1, calendar=calendar)
+        self.assertEqual(sample.searchsorted(moment), 86401)
+
+    def test_calendars(self):
+        sample = datetime.EpochDateTimes(np.arange(10), 'days',
+                                         epoch=self.epoch)
+        with self.assertRaises(NotImplementedError):
+            sample.searchsorted(datetime.datetime(
+                2000, 1, 1, calendar=datetime.G365Day()))
+
+
+class TestEpochDateTimesPeriods(unittest.TestCase):
+    def sample(self, calendar):
+        epoch = datetime.datetime(2000, 1, 1, calendar=calendar)
+        return datetime.EpochDateTimes(np.arange(0, 400 * 24, 6), 'hours',
+                                       epoch=epoch)
+
+    def test_months(self):
+        expected = {datetime.G360Day: [30, 30, 30],
+                    datetime.G365Day: [31, 28, 31],
+                    datetime.GregorianNoLeapSecond: [31, 29, 31]}
+        for calendar, days in expected.items():
+            labels, starts = self.sample(calendar()).period_groups('month')
+            np.testing.assert_array_equal(labels[:3],
+                                          [24000, 24001, 24002])
+            np.testing.assert_array_equal(np.diff(starts)[:3] // 4, days)
+
+    def test_seasons(self):
+        sample = self.sample(datetime.G365Day())
+        labels, starts = sample.period_groups('season')
+        np.testing.assert_array_equal(labels, [8000, 8001, 8002, 8003, 8004])
+        totals = np.add.reduceat(np.ones(len(sample)), starts) / 4
+        np.testing.assert_array_equal(totals, [59, 92, 92, 91, 66])
+
+    def test_labels(self):
+        sample = self.sample(datetime.G360Day())
+        counts = np.bincount(sample.period_labels('year') - 2000)
+        np.testing.assert_array_equal(counts, [360 * 4, 40 * 4])
+        with self.assertRaises(ValueError):
+            sample.period_labels('week')
+
+    def test_masked_groups(self):
+        epoch = datetime.datetime(2000, 1, 1, calendar=datetime.G365Day())
+        offsets = np.ma.masked_array([0, 40, 80, 100], mask=[0, 1, 0, 0])
+        sample = datetime.EpochDateTimes(offsets, 'days', epoch=epoch)
+        labels, starts = sample.period_groups('month')
+        self.assertEqual(labels.tolist(), [24000, None, 24002, 24003])
+        self.assertEqual(starts.tolist(), [0, 1, 2, 3])
+        totals = np.add.reduceat(offsets.data, starts)
+        self.assertEqual(totals[~labels.mask].tolist(), [0, 80, 100])
+
+
+class TestEpochDateTimesRebase(unittest.TestCase):
+    def setUp(self):
+        self.calendar = datetime.GregorianNoLeapSecond()
+
+    def moment(self, *args):
+        return datetime.datetime(*args, calendar=self.calendar)
+
+    def test_days_to_seconds(self):
+        sample = datetime.EpochDateTimes(np.array([0, 365, 36524]), 'days',
+                                         epoch=self.moment(1850, 1, 1))
+        result, inexact = sample.rebase(self.moment(1970, 1, 1), 'seconds')
+        np.testing.assert_array_equal(result.offsets.offsets,
+                                      [-3786825600, -3755289600, -631152000])
+        self.assertFalse(inexact.any())
+        self.assertEqual(str(result), str(sample))
+
+    def test_inexact(self):
+        sample = datetime.EpochDateTimes(np.array([-1, 24, 30]), 'hours',
+                                         epoch=self.moment(2000, 1, 1))
+        result, inexact = sample.rebase(self.moment(2000, 1, 1), 'days')
+        np.testing.assert_array_equal(result.offsets.offsets, [-1, 1, 1])
+        np.testing.assert_array_equal(inexact, [True, False, True])
+
+    def test_leap_seconds(self):
+        calendar = datetime.ISOGregorian()
+        epoch = datetime.datetime(2016, 12, 31, calendar=calendar)
+        sample = datetime.EpochDateTimes(np.array([1, 2]), 'days',
+                                         epoch=epoch)
+        result, inexact = sample.rebase(epoch, 'seconds')
+        np.testing.assert_array_equal(result.offsets.offsets,
+                                      [86401, 172801])
+        result, inexact = result.rebase(epoch, 'days')
+        np.testing.assert_array_equal(result.offsets.offsets, [1, 2])
+
+    def test_float(self):
+        sample = datetime.EpochDateTimes(np.array([0.5, 1.25]), 'days',
+                                         epoch=self.moment(2000, 1, 1))
+        result, inexact = sample.rebase(self.moment(2000, 1, 2), 'hours')
+        np.testing.assert_array_equal(result.offsets.offsets, [-12., 6.])
+
+    def test_overflow(self):
+        sample = datetime.EpochDateTimes(np.array([0, 36524]), 'days',
+                                         epoch=self.moment(1850, 1, 1))
+        with self.assertRaises(OverflowError):
+            sample.rebase(self.moment(1970, 1, 1), 'seconds',
+                          dtype=np.int32)
+        sample = datetime.EpochDateTimes(np.array([2 ** 62]), 'days',
+                                         epoch=self.moment(1850, 1, 1))
+        with self.assertRaises(OverflowError):
+            sample.rebase(self.moment(1970, 1, 1), 'hours')
+
+
+class TestEpochDateTimesMonths(unittest.TestCase):
+    def test_months(self):
+        epoch = datetime.datetime(1850, 1, 31,
+                                  calendar=datetime.GregorianNoLeapSecond())
+        sample = datetime.EpochDateTimes(np.array([-1, 1, 13, 1200]),
+                                         'months', epoch=epoch)
+        self.assertEqual(sample.datetimes().tolist(),
+                         ['1849-12-31T00:00:00', '1850-02-28T00:00:00',
+                          '1851-02-28T00:00:00', '1950-01-31T00:00:00'])
+
+    def test_null_year(self):
+        calendar = datetime.GregorianNoLeapSecond()
+        epoch = datetime.datetime(-1, 6, 1, calendar=calendar)
+        for unit in ['months', 'years']:
+            offsets = np.arange(-30, 30)
+            sample = datetime.EpochDateTimes(offsets, unit, epoch=epoch)
+            expected = [str(epoch + datetime.timedelta(**{unit: int(n)}))
+                        for n in offsets]
+            self.assertEqual(sample.datetimes().tolist(), expected)
+
+    def test_index_years(self):
+        calendar = datetime.GregorianNoLeapSecond()
+        indices = np.arange(-3, 3)
+        np.testing.assert_array_equal(calendar.index_years(indices),
+                                      [calendar.index_year(index)
+                                       for index in indices])
+
+
+class Julian(datetime.Calendar):
+    # A calendar with a custom leap year rule, which has no closed form
+    # leap year count.
+    def __init__(self):
+        month_names = ['January', 'February', 'March', 'April', 'May',
+                       'June', 'July', 'August', 'September', 'October',
+                       'November', 'December']
+        month_day_map = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+        super(Julian, self).__init__(None, datetime.date(None, 2, 29),
+                                     month_names, month_day_map)
+
+    def is_leap_year(self, year):
+        return year % 4 == 0
+
+
+@unittest.skipIf(sys.version_info < (3, 8),
+                 'Converting in processes requires Python 3.8 or later.')
+class TestEpochDateTimesWorkers(unittest.TestCase):
+    def setUp(self):
+        epoch = datetime.datetime(1900, 2, 1, calendar=Julian())
+        offsets = np.ma.masked_array(np.arange(40) * 7, mask=[1] + [0] * 39)
+        self.sample = datetime.EpochDateTimes(offsets, 'days', epoch=epoch)
+
+    def test_datetimes(self):
+        result = self.sample.datetimes(workers=2)
+        expected = self.sample.datetimes()
+        self.assertEqual(result.tolist(), expected.tolist())
+        self.assertEqual(result[4], '1900-02-29T00:00:00')
+
+    def test_empty(self):
+        result = self.sample[:0].convert_in_processes(2)
+        self.assertEqual(result.shape, (0,))
+        self.assertEqual(result.dtype.kind, 'U')
+
+    def test_write_strings(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, 'strings.bin')
+            self.sample.write_strings(path, chunk_size=10, workers=2)
+            result = np.fromfile(path, dtype='S26')
+            self.assertEqual(result[0], b'')
+            self.assertEqual(result[1], b'1900-02-08T00:00:00')
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_refreshed_leap_seconds(self):
+        before = datetime.ISOGregorian()
+        table = datetime.leap_seconds()
+        try:
+            # As refresh_leap_seconds does, with one more leap second.
+            datetime._leap_seconds = table + [(1, 'Jan', 2030)]
+            datetime._calendars.pop(datetime.ISOGregorian)
+            calendar = datetime.ISOGregorian()
+            epoch = datetime.datetime(2029, 12, 31, 23, 59, 58,
+                                      calendar=calendar)
+            sample = datetime.EpochDateTimes(np.arange(4), 'seconds',
+                                             epoch=epoch)
+            self.assertEqual(sample.datetimes(workers=2).tolist(),
+                             sample.datetimes().tolist())
+            self.assertEqual(sample.datetimes()[2], '2029-12-31T23:59:59')
+            self.assertEqual(pickle.loads(pickle.dumps(before)), before)
+            # As a spawned worker does, given the table of its parent.
+            datetime._use_leap_seconds(table)
+            self.assertEqual(datetime.ISOGregorian(), before)
+        finally:
+            datetime._leap_seconds = table
+            datetime._calendars[datetime.ISOGregorian] = before
+
+
+class TestDatetime64(unittest.TestCase):
+    def setUp(self):
+        self.calendar = datetime.GregorianNoLeapSecond()
+
+    def test_view(self):
+        epoch = datetime.datetime(1970, 1, 1, calendar=self.calendar)
+        offsets = np.arange(-1000, 1000, 7)
+        sample = datetime.EpochDateTimes(offsets, 'days', epoch=epoch)
+        result = sample.to_datetime64()
+        self.assertEqual(result.dtype, np.dtype('datetime64[D]'))
+        self.assertTrue(np.shares_memory(result, offsets))
+        self.assertEqual(result.astype(str).tolist(),
+                         [s[:10] for s in sample.datetimes().tolist()])
+
+    def test_epoch_shift(self):
+        epoch = datetime.datetime(1850, 3, 1, 6, calendar=self.calendar)
+        offsets = np.arange(0, 100000, 37)
+        sample = datetime.EpochDateTimes(offsets, 'hours', epoch=epoch)
+        self.assertEqual(sample.to_datetime64().astype('datetime64[s]')
+                         .astype(str).tolist(), sample.datetimes().tolist())
+        result = sample.to_datetime64('m')
+        self.assertEqual(result.dtype, np.dtype('datetime64[m]'))
+        self.assertEqual(result.astype('datetime64[s]').astype(str).tolist(),
+                         sample.datetimes().tolist())
+        with self.assertRaises(ValueError):
+            sample.to_datetime64('D')
+
+    def test_epoch_within_day(self):
+        epoch = datetime.datetime(2000, 1, 1, 0, 0, 30, calendar=self.calendar)
+        offsets = np.ma.masked_array([0, 1, 2], mask=[0, 1, 0])
+        sample = datetime.EpochDateTimes(offsets, 'days', epoch=epoch)
+        result = sample.to_datetime64()
+        self.assertEqual(result.dtype, np.dtype('datetime64[s]'))
+        self.assertEqual(result.astype(str).tolist(),
+                         ['2000-01-01T00:00:30', 'NaT', '2000-01-03T00:00:30'])
+        epoch = datetime.datetime(2000, 1, 1, calendar=self.calendar)
+        sample = datetime.EpochDateTimes(np.array([0, 1.5]), 'days',
+                                         epoch=epoch)
+        self.assertEqual(sample.to_datetime64().astype(str).tolist(),
+                         ['2000-01-01T00', '2000-01-02T12'])
+
+    def test_round_trip(self):
+        values = np.array(['1850-01-01T00:00', '2000-02-29T12:30', 'NaT'],
+                          dtype='datetime64[m]')
+        sample = datetime.EpochDateTimes.from_datetime64(values)
+        self.assertEqual(sample.mask.tolist(), [False, False, True])
+        self.assertEqual(sample.datetimes()[1], '2000-02-29T12:30:00')
+        np.testing.assert_array_equal(sample.to_datetime64(), values)
+
+    def test_months(self):
+        values = np.array(['1850-01', '2000-02'], dtype='datetime64[M]')
+        sample = datetime.EpochDateTimes.from_datetime64(values)
+        self.assertEqual(sample.offsets.unit.unit, 'months')
+        np.testing.assert_array_equal(sample.to_datetime64(), values)
+
+    def test_fine_units(self):
+        values = np.array(['2000-01-01T00:00:00.5'], dtype='datetime64[ns]')
+        sample = datetime.EpochDateTimes.from_datetime64(values)
+        self.assertEqual(sample.datetimes()[0], '2000-01-01T00:00:00.500000')
+
+    def test_leap_seconds(self):
+        calendar = datetime.ISOGregorian()
+        values = np.array(['2016-12-31T23:59:59', '2017-01-01T00:00:00'],
+                          dtype='datetime64[s]')
+        sample = datetime.EpochDateTimes.from_datetime64(values, calendar)
+        self.assertEqual(np.diff(sample.offsets.offsets).tolist(), [2])
+        np.testing.assert_array_equal(sample.to_datetime64(), values)
+
+    def test_before_year_one(self):
+        epoch = datetime.datetime(1, 1, 1, calendar=self.calendar)
+        sample = datetime.EpochDateTimes(np.array([-1]), 'days', epoch=epoch)
+        with self.assertRaises(ValueError):
+            sample.to_datetime64()
+
+
+class TestTimedeltaArray(unittest.TestCase):
+    def setUp(self):
+        self.calendars = [datetime.G360Day(), datetime.G365Day(),
+                          datetime.GregorianNoLeapSecond(),
+                          datetime.ISOGregorian()]
+        self.components = [(-2, 1, 31, 0, 0, 0), (1850, 2, 28, 12, 30, 15),
+                           (2000, 2, 29, 23, 59, 59),
+                           (2016, 12, 31, 23, 59, 58)]
+
+    def test_scalar_equivalence(self):
+        quantities = {'years': [-3, 1, 4, 1], 'months': [11, -25, 12, 1],
+                      'days': [400, -1, 366, 1],
+                      'hours': [-30, 5, 1, 24], 'minutes': [61, -1, 1, 0],
+                      'seconds': [2, -86400, 1, 3],
+                      'microseconds': [1, -1, 10 ** 6, 0]}
+        for calendar in self.calendars:
+            instants = [datetime.datetime(*components, calendar=calendar)
+                        for components in self.components
+                        if components[2] <= calendar.month_lengths(
+                            components[0], components[1])]
+            array = datetime.DatetimeArray.from_datetimes(instants,
+                                                          calendar=calendar)
+            for quantity, values in quantities.items():
+                values = values[:len(instants)]
+                deltas = datetime.TimedeltaArray(**{quantity: values})
+                expected = [str(instant +
+                                datetime.timedelta(**{quantity: value}))
+                            for instant, value in zip(instants, values)]
+                self.assertEqual((array + deltas).strings().tolist(),
+                                 expected)
+
+    def test_independent_quantities(self):
+        array = datetime.DatetimeArray.from_datetimes(
+            [datetime.datetime(2000, 2, 29)])
+        deltas = datetime.TimedeltaArray(years=1, months=1, days=1)
+        self.assertEqual((array + deltas).strings().tolist(),
+                         ['2001-03-29T00:00:00'])
+
+    def test_broadcast_timedelta(self):
+        array = datetime.DatetimeArray.from_datetimes(
+            [datetime.datetime(2000, 1, 31), datetime.datetime(2001, 1, 31)])
+        result = array - datetime.timedelta(months=11)
+        self.assertEqual(result.strings().tolist(),
+                         ['1999-02-28T00:00:00', '2000-02-29T00:00:00'])
+
+    def test_leap_seconds(self):
+        calendar = datetime.ISOGregorian()
+        start = datetime.datetime(2016, 12, 31, 23, 59, 58, calendar=calendar)
+        array = datetime.DatetimeArray.from_datetimes([start] * 2,
+                                                      calendar=calendar)
+        result = array + datetime.TimedeltaArray(seconds=[2, 3])
+        self.assertEqual(result.strings().tolist(),
+                         ['2016-12-31T23:59:59', '2017-01-01T00:00:00'])
+
+    def test_mask(self):
+        array = datetime.DatetimeArray.from_datetimes(
+            [datetime.datetime(2000, 1, 1)] * 3)
+        deltas = datetime.TimedeltaArray(days=[1, 2, 3], mask=[0, 1, 0])
+        result = array + deltas
+        self.assertEqual(result.mask.tolist(), [False, True, False])
+        self.assertEqual((deltas + deltas).days.tolist(), [2, 4, 6])
+        self.assertEqual((-deltas)[1:].mask.tolist(), [True, False])
+
+
+class TestWeekdays(unittest.TestCase):
+    def setUp(self):
+        calendar = datetime.ISOGregorian()
+        epoch = datetime.datetime(1999, 12, 25, calendar=calendar)
+        offsets = np.ma.masked_array(np.arange(20), mask=[1] + [0] * 19)
+        self.sample = datetime.EpochDateTimes(offsets, 'days', epoch=epoch)
+
+    def test_weekday(self):
+        weekdays = self.sample.weekday()
+        names = self.sample.calendar.weekday_names
+        # 1999-12-25 was a Saturday.
+        self.assertEqual(names[weekdays[1]], 'Sunday')
+        self.assertTrue(weekdays[0] is np.ma.masked)
+
+    def test_dayofyear(self):
+        result = self.sample.dayofyear()
+        self.assertEqual(result[1:].tolist(), list(range(360, 366)) +
+                         list(range(1, 14)))
+
+    def test_week_of_year(self):
+        # Week 1 of 2000 starts on Sunday 2 January, as for %U.
+        result = self.sample.week_of_year()
+        self.assertEqual(result[6:10].tolist(), [52, 0, 1, 1])
+
+    def test_no_weeks(self):
+        array = datetime.DatetimeArray(np.arange(3),
+                                       calendar=datetime.G360Day())
+        self.assertEqual(array.dayofyear().tolist(), [1, 2, 3])
+        with self.assertRaises(ValueError):
+            array.weekday()
+
+
+class TestFormatComponents(unittest.TestCase):
+    def setUp(self):
+        self.components = [np.array((2001, 17)), np.array((8, 1)),
+                           np.array((7, 2)), np.array((11, 0)),
+                           np.array((3, 59)), np.array((5, 9)),
+                           np.array((0, 34))]
+
+    def test_unicode(self):
+        result = datetime.format_components(self.components)
+        expected = [str(datetime.datetime(2001, 8, 7, 11, 3, 5)),
+                    str(datetime.datetime(17, 1, 2, 0, 59, 9, 34))]
+        self.assertEqual(result.tolist(), expected)
+        self.assertEqual(result.dtype, np.dtype('U26'))
+
+    def test_bytes(self):
+        components = [column[:1] for column in self.components]
+        result = datetime.format_components(components, tsep=' ', kind='S')
+        self.assertEqual(result.tolist(), [b'2001-08-07 11:03:05'])
+        self.assertEqual(result.dtype, np.dtype('S19'))
+
+
+class TestLeapSeconds(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'leap-seconds.list')
+        # NTP seconds, one day from now.
+        self.expiry = int(time.time()) + 2208988800 + 86400
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def write_list(self, expiry):
+        with open(self.path, 'w') as fout:
+            fout.write('#\tleap seconds\n'
+                       '#@\t{}\n'
+                       '2272060800\t10\t# 1 Jan 1972\n'
+                       '2287785600\t11\t# 1 Jul 1972\n'.format(expiry))
+
+    def test_parse(self):
+        self.write_list(self.expiry)
+        with open(self.path) as fin:
+            table, expiry = datetime.parse_leap_seconds_list(fin.read())
+        self.assertEqual(table, [(1, 'Jan', 1972), (1, 'Jul', 1972)])
+        self.assertEqual(expiry, self.expiry)
+
+    def test_bundled(self):
+        table = datetime._load_leap_seconds()
+        self.assertEqual(table[-1], (1, 'Jan', 2017))
+
+    def test_cache(self):
+        self.write_list(self.expiry)
+        table = datetime._load_leap_seconds(self.path)
+        self.assertEqual(len(table), 2)
+
+    def test_expired_cache(self):
+        self.write_list(self.expiry - 2 * 86400)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            table = datetime._load_leap_seconds(self.path)
+        self.assertEqual(len(caught), 1)
+        self.assertEqual(table[-1], (1, 'Jan', 2017))
+
+    def test_shared_table(self):
+        self.assertIs(datetime.ISOGregorian().leapsecond_datetimes,
+                      datetime.ISOGregorian().leapsecond_datetimes)
+
+
 class Testtimedelta(unittest.TestCase):
     def test_foo(self):
         pass
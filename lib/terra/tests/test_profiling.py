@@ -0,0 +1,115 @@
+import json
+import unittest
+
+import numpy as np
+
+import terra
+import terra.datetime
+import terra.profiling
+
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        calendar = terra.datetime.GregorianNoLeapSecond()
+        epoch = terra.datetime.datetime(2001, 8, 7, calendar=calendar)
+        self.sample = terra.datetime.EpochDateTimes(np.arange(5), 'days',
+                                                    epoch=epoch)
+
+    def tearDown(self):
+        terra.profiling.disable()
+        terra.profiling.reset()
+
+    def test_disabled(self):
+        original = vars(terra.datetime.EpochDateTimes)['datetimes']
+        self.sample.datetimes()
+        self.assertFalse(terra.profiling.enabled())
+        self.assertEqual(terra.profiling.snapshot(), {})
+        with terra.profiling.profile():
+            self.assertIsNot(vars(terra.datetime.EpochDateTimes)['datetimes'],
+                             original)
+        self.assertIs(vars(terra.datetime.EpochDateTimes)['datetimes'],
+                      original)
+
+    def test_counts(self):
+        with terra.profiling.profile():
+            self.sample.datetimes()
+            self.sample.datetimes()
+            terra.datetime.parse_datetimes(np.array(['2000-01-01']),
+                                           self.sample.calendar)
+        result = terra.profiling.snapshot()
+        datetimes = result['terra.datetime.EpochDateTimes.datetimes']
+        self.assertEqual(datetimes['calls'], 2)
+        self.assertEqual(datetimes['elements'], 10)
+        self.assertGreater(datetimes['seconds'], 0)
+        self.assertEqual(result['terra.datetime.parse_datetimes']['elements'],
+                         1)
+
+    def test_parse_elements(self):
+        calendar = self.sample.calendar
+        strings = np.array([['2000-01-01'] * 3] * 2)
+        with terra.profiling.profile():
+            terra.datetime.parse_datetimes(strings, calendar)
+            result, _ = terra.datetime.parse_datetimes(
+                (string for string in ['2000-01-02']), calendar)
+        self.assertEqual(str(result[0]), '2000-01-02T00:00:00')
+        counts = terra.profiling.snapshot()['terra.datetime.parse_datetimes']
+        self.assertEqual(counts['calls'], 2)
+        self.assertEqual(counts['elements'], 7)
+
+    def test_failing_counter(self):
+        def elements(result, *args, **kwargs):
+            raise TypeError('no count')
+        original = terra.datetime.parse_datetime
+        key = terra.profiling.instrument(terra.datetime, 'parse_datetime',
+                                         elements, key='failing')
+        try:
+            with terra.profiling.profile():
+                terra.datetime.parse_datetime('2000-01-01',
+                                              self.sample.calendar)
+            counts = terra.profiling.snapshot()[key]
+            self.assertEqual((counts['calls'], counts['elements']), (1, 0))
+            self.assertIs(terra.datetime.parse_datetime, original)
+        finally:
+            terra.profiling._points.pop(key)
+            terra.profiling._counters.pop(key)
+
+    def test_nested(self):
+        adate = terra.datetime.date(2001, 8, 7)
+        delta = terra.datetime.timedelta(days=3)
+        with terra.profiling.profile():
+            with terra.profiling.profile(reset_counts=False):
+                adate + delta
+            self.assertTrue(terra.profiling.enabled())
+            adate + delta
+        self.assertFalse(terra.profiling.enabled())
+        adate + delta
+        result = terra.profiling.snapshot()
+        self.assertEqual(result['terra.datetime.date.__add__']['calls'], 2)
+
+    def test_arithmetic(self):
+        adate = terra.datetime.date(2001, 8, 7)
+        with terra.profiling.profile():
+            adate + terra.datetime.timedelta(days=3)
+        result = terra.profiling.snapshot()
+        self.assertEqual(result['terra.datetime.date.__add__']['calls'], 1)
+
+    def test_parse_wktcrs(self):
+        wkt = ('TIMECRS["GPS Time",'
+               'TDATUM["Time origin",TIMEORIGIN[2001-08-07T00:00:00Z]],'
+               'CS[temporal,1],AXIS["time",future],TIMEUNIT["day",86400]]')
+        with terra.profiling.profile():
+            terra.parse_wktcrs(wkt)
+        result = json.loads(terra.profiling.to_json())
+        self.assertEqual(result['terra.parse_wktcrs']['calls'], 1)
+
+    def test_calendar_construction(self):
+        with terra.profiling.profile():
+            terra.datetime.Calendar(month_names=['Year'],
+                                    month_day_map=[365])
+        result = terra.profiling.snapshot()
+        self.assertEqual(result['terra.datetime.Calendar.__init__']['calls'],
+                         1)
+
+
+if __name__ == '__main__':
+    unittest.main()